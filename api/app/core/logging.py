@@ -3,7 +3,11 @@ import sys
 import os
 from typing import Any
 
-def setup_logging(log_level: str = "INFO", log_file: str = "api/app/logs/rag_system.log"):
+# Anchored to the package (api/app/logs/), not the working directory, so scripts run from
+# anywhere log to the same file instead of leaving stray logs/ trees behind
+DEFAULT_LOG_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs", "rag_system.log")
+
+def setup_logging(log_level: str = "INFO", log_file: str = DEFAULT_LOG_FILE):
     """
     Configure structured logging for the application.
     Writes to both console (stdout) and a file.
@@ -14,14 +14,18 @@ class ClaudeLLM(LLM):
     def __init__(self, config: dict):
         super().__init__(config)
         api_key = os.environ.get(config.get("api_key_env", "ANTHROPIC_API_KEY"))
-        self.client = anthropic.Anthropic(api_key=api_key)
+        client_kwargs = {}
+        # Optional per-request timeout (seconds); the SDK default applies when unset
+        if config["config"].get("timeout") is not None:
+            client_kwargs["timeout"] = config["config"]["timeout"]
+        self.client = anthropic.Anthropic(api_key=api_key, **client_kwargs)
         self.model = config["config"]["model"]
         self.temperature = config["config"].get("temperature", 0.7)
         self.max_tokens = config["config"].get("max_tokens", 2048)
 
     def generate(self, messages: List[Dict[str, str]], context: str, system_prompt: str = None) -> LLMResponse:
         """Generate answer using Claude"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         logger.info(f"Generating answer with {self.model}")
 
@@ -70,7 +74,7 @@ class ClaudeLLM(LLM):
             logger.info(f"Claude Answer: {answer_preview}...")
             logger.info(f"Tokens used: Input={response.usage.input_tokens}, Output={response.usage.output_tokens}")
 
-            generation_time = time.time() - start_time
+            generation_time = time.perf_counter() - start_time
 
             # Pricing
             input_cost = response.usage.input_tokens * 3.00 / 1_000_000
@@ -21,7 +21,7 @@ class GPT4LLM(LLM):
 
     def generate(self, messages: List[Dict[str, str]], context: str, system_prompt: str = None) -> LLMResponse:
         """Generate answer using GPT-4"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         logger.info(f"Generating answer with {self.model}")
 
@@ -69,7 +69,7 @@ class GPT4LLM(LLM):
             logger.info(f"GPT-4 Answer: {answer_preview}...")
             logger.info(f"Tokens used: Total={tokens_used}")
 
-            generation_time = time.time() - start_time
+            generation_time = time.perf_counter() - start_time
 
             # Pricing
             input_cost = response.usage.prompt_tokens * 10.00 / 1_000_000
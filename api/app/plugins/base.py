@@ -32,6 +32,16 @@ class DataRetrievalPlugin(ABC):
         """Return plugin capabilities (supports_js, rate_limit, etc.)"""
         pass
 
+    def close(self):
+        """Release resources held by the plugin (e.g. pooled HTTP connections)"""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
 @dataclass
 class StandardResponse:
     """Standardized response format"""
@@ -3,6 +3,7 @@ Jina AI Reader plugin for data retrieval.
 Uses Jina's free r.jina.ai service to convert URLs to markdown.
 """
 import httpx
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 from datetime import datetime
 from api.app.plugins.base import DataRetrievalPlugin, StandardDocument
@@ -15,7 +16,13 @@ class JinaPlugin(DataRetrievalPlugin):
     Jina AI Reader plugin.
 
     Uses https://r.jina.ai/{url} to fetch and convert web pages to markdown.
-    No API key required for basic usage.
+    No API key required for basic usage. Holds a pooled HTTP client, so use it as a
+    context manager (or call close()) when done.
+
+    Options:
+        batch_size: Still accepted, but no longer limits how many requests are in flight;
+            set max_concurrency for that
+        max_concurrency: Fetches in flight at once, and the connection pool size (default 2)
     """
 
     def __init__(self, config: Dict):
@@ -23,6 +30,20 @@ class JinaPlugin(DataRetrievalPlugin):
         self.base_url = "https://r.jina.ai"
         self.api_key = config.get("api_key")  # Optional
         self.batch_size = config.get("options", {}).get("batch_size", 10)
+        # Kept low by default so batch fetches stay well inside r.jina.ai's free-tier rate limit
+        self.max_concurrency = max(1, config.get("options", {}).get("max_concurrency", 2))
+
+        # One pooled client per plugin, so fetches reuse keep-alive connections to r.jina.ai
+        # instead of opening (and TLS-handshaking) a new one per URL
+        headers = {}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        self.client = httpx.Client(
+            headers=headers,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=self.max_concurrency,
+                                max_keepalive_connections=self.max_concurrency),
+        )
 
     def fetch_url(self, url: str) -> StandardDocument:
         """
@@ -37,31 +58,26 @@ class JinaPlugin(DataRetrievalPlugin):
         jina_url = f"{self.base_url}/{url}"
         logger.info(f"Fetching URL via Jina: {jina_url}")
 
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-
         try:
-            with httpx.Client(timeout=30.0) as client:
-                response = client.get(jina_url, headers=headers)
-                response.raise_for_status()
-
-                markdown_content = response.text
-                logger.info(f"Successfully fetched content. Length: {len(markdown_content)}")
-
-                # Extract metadata from headers if available
-                metadata = {
-                    "content_length": len(markdown_content),
-                    "jina_response_time": response.elapsed.total_seconds(),
-                }
-
-                return StandardDocument(
-                    url=url,
-                    content=markdown_content,
-                    metadata=metadata,
-                    timestamp=datetime.utcnow().isoformat(),
-                    source_plugin="jina"
-                )
+            response = self.client.get(jina_url)
+            response.raise_for_status()
+
+            markdown_content = response.text
+            logger.info(f"Successfully fetched content. Length: {len(markdown_content)}")
+
+            # Extract metadata from headers if available
+            metadata = {
+                "content_length": len(markdown_content),
+                "jina_response_time": response.elapsed.total_seconds(),
+            }
+
+            return StandardDocument(
+                url=url,
+                content=markdown_content,
+                metadata=metadata,
+                timestamp=datetime.utcnow().isoformat(),
+                source_plugin="jina"
+            )
 
         except httpx.HTTPError as e:
             logger.error(f"Jina fetch error: {str(e)}")
@@ -77,23 +93,34 @@ class JinaPlugin(DataRetrievalPlugin):
         Returns:
             List of StandardDocuments
         """
-        documents = []
         logger.info(f"Batch fetching {len(urls)} URLs")
+        if not urls:
+            return []
 
-        # Process in batches for rate limiting
-        for i in range(0, len(urls), self.batch_size):
-            batch = urls[i:i + self.batch_size]
+        def fetch_or_none(url: str):
+            try:
+                return self.fetch_url(url)
+            except Exception as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
 
-            for url in batch:
-                try:
-                    doc = self.fetch_url(url)
-                    documents.append(doc)
-                except Exception as e:
-                    logger.error(f"Error fetching {url}: {e}")
-                    continue
+        # Fetches are network-bound, so run up to max_concurrency at once (rate limiting) on the
+        # shared client; map() keeps the documents in URL order
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(urls))) as executor:
+            documents = [doc for doc in executor.map(fetch_or_none, urls) if doc is not None]
 
         return documents
 
+    def close(self):
+        """Close the pooled HTTP client and its keep-alive connections"""
+        self.client.close()
+
+    def __del__(self):
+        # Safety net for callers that never close() the plugin or use it as a context manager
+        client = getattr(self, "client", None)
+        if client is not None:
+            client.close()
+
     def get_capabilities(self) -> Dict:
         """Return plugin capabilities"""
         return {
@@ -91,7 +91,8 @@ class DocumentProcessor:
     def process_and_store(
         self,
         documents: List[StandardDocument],
-        collection_name: str = "website_content"
+        collection_name: str = "website_content",
+        batch_size: int = 100
     ) -> Dict:
         """
         Process documents and store in ChromaDB.
@@ -99,6 +100,7 @@ class DocumentProcessor:
         Args:
             documents: List of StandardDocuments
             collection_name: Name of ChromaDB collection
+            batch_size: Chunks embedded per OpenAI request (batches span documents)
 
         Returns:
             Statistics about the processing
@@ -109,7 +111,9 @@ class DocumentProcessor:
             metadata={"description": "Website content for RAG"}
         )
 
-        total_chunks = 0
+        all_chunks = []
+        all_metadatas = []
+        all_ids = []
 
         for doc in documents:
             # Chunk the document
@@ -119,12 +123,10 @@ class DocumentProcessor:
                 continue
 
             logger.info(f"Generated {len(chunks)} chunks for document: {doc.url}")
-
-            # Generate embeddings
-            embeddings = self.generate_embeddings(chunks)
+            all_chunks.extend(chunks)
 
             # Prepare metadata
-            metadatas = [
+            all_metadatas.extend(
                 {
                     "url": doc.url,
                     "source_plugin": doc.source_plugin,
@@ -133,24 +135,31 @@ class DocumentProcessor:
                     **doc.metadata
                 }
                 for i in range(len(chunks))
-            ]
+            )
 
             # Generate IDs
-            ids = [f"{doc.url}_{i}" for i in range(len(chunks))]
+            all_ids.extend(f"{doc.url}_{i}" for i in range(len(chunks)))
+
+        # Embed and store in fixed-size batches across documents, so many small pages
+        # share one embeddings request instead of paying one round-trip each
+        for start in range(0, len(all_chunks), batch_size):
+            end = start + batch_size
+            chunks = all_chunks[start:end]
+
+            # Generate embeddings
+            embeddings = self.generate_embeddings(chunks)
 
             # Store in ChromaDB
             collection.add(
                 embeddings=embeddings,
                 documents=chunks,
-                metadatas=metadatas,
-                ids=ids
+                metadatas=all_metadatas[start:end],
+                ids=all_ids[start:end]
             )
 
-            total_chunks += len(chunks)
-
         return {
             "documents_processed": len(documents),
-            "total_chunks": total_chunks,
+            "total_chunks": len(all_chunks),
             "collection_name": collection_name
         }
 
@@ -6,6 +6,7 @@ Implements two-tier hybrid caching:
 - Tier 2: Semantic match via vector similarity (30-50ms)
 """
 
+import functools
 import hashlib
 import json
 import os
@@ -16,6 +17,18 @@ import chromadb
 from openai import OpenAI
 
 
+@functools.lru_cache(maxsize=None)
+def _get_chroma_client(host: str, port: int):
+    """Shared ChromaDB HTTP client per server, reused across SemanticCacheManager instances."""
+    return chromadb.HttpClient(host=host, port=port)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_openai_client(api_key: Optional[str]) -> OpenAI:
+    """Shared OpenAI client (and its connection pool) per API key."""
+    return OpenAI(api_key=api_key)
+
+
 class SemanticCacheManager:
     """
     Manages semantic caching of search results using ChromaDB.
@@ -44,7 +57,7 @@ class SemanticCacheManager:
             semantic_threshold: Minimum similarity score for semantic matches (0.0-1.0)
         """
         # Connect to existing ChromaDB instance
-        self.chroma_client = chromadb.HttpClient(host=chroma_host, port=chroma_port)
+        self.chroma_client = _get_chroma_client(chroma_host, chroma_port)
 
         # Get or create cache collection
         self.collection = self.chroma_client.get_or_create_collection(
@@ -53,7 +66,7 @@ class SemanticCacheManager:
         )
 
         # Initialize OpenAI client for embeddings
-        self.openai_client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        self.openai_client = _get_openai_client(os.environ.get("OPENAI_API_KEY"))
         self.embedding_model = embedding_model
 
         # Configuration
@@ -70,8 +83,10 @@ class SemanticCacheManager:
             "total_semantic_time": 0.0
         }
 
-    def _generate_cache_key(self, tool: str, question: str, context: str = "") -> str:
-        """Generate a deterministic cache key from inputs."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _generate_cache_key(tool: str, question: str, context: str = "") -> str:
+        """Generate a deterministic cache key from inputs (memoized: lookups and stores repeat the same inputs)."""
         combined = f"{tool}|{question}|{context}"
         return hashlib.sha256(combined.encode()).hexdigest()
 
@@ -87,11 +102,37 @@ class SemanticCacheManager:
             print(f"Warning: Embedding generation failed: {e}")
             return None
 
+    def embed_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Generate embeddings for several texts in a single OpenAI request.
+
+        The vectors can be passed as query_embedding to get_cached_search /
+        store_search_result to skip per-call embedding.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings aligned with texts (all None if the request failed)
+        """
+        if not texts:
+            return []
+        try:
+            response = self.openai_client.embeddings.create(
+                model=self.embedding_model,
+                input=texts
+            )
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        except Exception as e:
+            print(f"Warning: Batch embedding generation failed: {e}")
+            return [None] * len(texts)
+
     def get_cached_search(
         self,
         tool: str,
         question: str,
-        context: str = ""
+        context: str = "",
+        query_embedding: Optional[List[float]] = None
     ) -> Tuple[Optional[Dict], str, float]:
         """
         Retrieve cached search result if available.
@@ -100,6 +141,7 @@ class SemanticCacheManager:
             tool: MCP tool name (jina, tavily, firecrawl, exa)
             question: User question
             context: Additional context (optional)
+            query_embedding: Precomputed embedding of question, e.g. from embed_batch (optional)
 
         Returns:
             Tuple of (cached_result, cache_status, retrieval_time)
@@ -107,7 +149,7 @@ class SemanticCacheManager:
             - cache_status: "exact_hit", "semantic_hit", or "miss"
             - retrieval_time: Time taken to check cache in seconds
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.stats["total_queries"] += 1
 
         cache_key = self._generate_cache_key(tool, question, context)
@@ -122,7 +164,7 @@ class SemanticCacheManager:
             if exact_results and exact_results["ids"]:
                 # Exact match found
                 cached_data = json.loads(exact_results["documents"][0])
-                retrieval_time = time.time() - start_time
+                retrieval_time = time.perf_counter() - start_time
 
                 self.stats["exact_hits"] += 1
                 self.stats["total_exact_time"] += retrieval_time
@@ -132,11 +174,12 @@ class SemanticCacheManager:
             print(f"Warning: Exact match lookup failed: {e}")
 
         # TIER 2: Semantic match via vector similarity
-        query_embedding = self._generate_embedding(question)
+        if query_embedding is None:
+            query_embedding = self._generate_embedding(question)
 
         if query_embedding is None:
             # Embedding failed, return miss
-            retrieval_time = time.time() - start_time
+            retrieval_time = time.perf_counter() - start_time
             self.stats["misses"] += 1
             return None, "miss", retrieval_time
 
@@ -160,7 +203,7 @@ class SemanticCacheManager:
                 if similarity >= self.semantic_threshold:
                     # Semantic match found
                     cached_data = json.loads(semantic_results["documents"][0][0])
-                    retrieval_time = time.time() - start_time
+                    retrieval_time = time.perf_counter() - start_time
 
                     self.stats["semantic_hits"] += 1
                     self.stats["total_semantic_time"] += retrieval_time
@@ -173,7 +216,7 @@ class SemanticCacheManager:
             print(f"Warning: Semantic match lookup failed: {e}")
 
         # TIER 3: Cache miss
-        retrieval_time = time.time() - start_time
+        retrieval_time = time.perf_counter() - start_time
         self.stats["misses"] += 1
 
         return None, "miss", retrieval_time
@@ -184,7 +227,8 @@ class SemanticCacheManager:
         question: str,
         context: str,
         search_result: Dict,
-        search_time: float
+        search_time: float,
+        query_embedding: Optional[List[float]] = None
     ) -> bool:
         """
         Store search result in cache.
@@ -195,13 +239,15 @@ class SemanticCacheManager:
             context: Additional context
             search_result: Search result data to cache
             search_time: Original search time (for statistics)
+            query_embedding: Precomputed embedding of question, e.g. from embed_batch (optional)
 
         Returns:
             True if successfully cached, False otherwise
         """
         try:
             cache_key = self._generate_cache_key(tool, question, context)
-            query_embedding = self._generate_embedding(question)
+            if query_embedding is None:
+                query_embedding = self._generate_embedding(question)
 
             if query_embedding is None:
                 return False
@@ -1,4 +1,5 @@
 import os
+import threading
 import time
 import requests
 import urllib.parse
@@ -15,6 +16,26 @@ class JinaTool(MCPTool):
         super().__init__(config)
         self.api_key = os.environ.get(config.get("api_key_env", "JINA_API_KEY"))
         self.base_url = "https://r.jina.ai"
+        # Optional seconds to wait on Jina before giving up. Off by default (None waits as long
+        # as the request takes) since full-page r.jina.ai reads can legitimately run long
+        self.timeout = config.get("config", {}).get("timeout")
+        # Persistent sessions: keep-alive connections to r.jina.ai / s.jina.ai are reused
+        # across searches instead of paying a TCP+TLS handshake per request. requests.Session
+        # isn't documented as thread-safe, so each thread (e.g. run_evaluation --workers) gets its own
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """This thread's Jina session, created on first use"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                "Authorization": f"Bearer {self.api_key}",
+                "X-Return-Format": "markdown"
+            })
+            self._local.session = session
+        return session
 
     def search(self, question: str, context: str = None) -> SearchResult:
         """
@@ -24,11 +45,6 @@ class JinaTool(MCPTool):
         2. If no context, SEARCH using the question.
         """
         start_time = time.time()
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "X-Return-Format": "markdown"
-        }
 
         content = ""
         sources = []
@@ -41,7 +57,7 @@ class JinaTool(MCPTool):
                 url = f"https://r.jina.ai/{context}"
                 
                 try:
-                    response = requests.get(url, headers=headers)
+                    response = self.session.get(url, timeout=self.timeout)
                     response.raise_for_status()
                     content = response.text
                     sources.append(context)
@@ -69,14 +85,14 @@ class JinaTool(MCPTool):
                 encoded_query = urllib.parse.quote(search_query)
                 url = f"https://s.jina.ai/{encoded_query}"
                 
-                response = requests.get(url, headers=headers)
+                response = self.session.get(url, timeout=self.timeout)
                 
                 # Handle 422 Fallback (Broad Search)
                 if response.status_code == 422:
                     logger.warning("Search 422. Retrying without site filter...")
                     encoded_simple = urllib.parse.quote(question)
                     url = f"https://s.jina.ai/{encoded_simple}"
-                    response = requests.get(url, headers=headers)
+                    response = self.session.get(url, timeout=self.timeout)
 
                 response.raise_for_status()
                 content = response.text
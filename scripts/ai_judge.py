@@ -4,11 +4,13 @@ Evaluates system answers based on absolute quality metrics.
 No baseline comparison required.
 """
 
-import json
+import hashlib
 import os
 import time
 import re
+from pathlib import Path
 from typing import Dict, List, Optional
+import orjson
 from anthropic import Anthropic
 from pydantic import BaseModel, Field, ValidationError # Import BaseModel and Field
 
@@ -22,20 +24,41 @@ class JudgeResult(BaseModel):
     reasoning: str
     overall_quality: float = 0.0 # Add this field to the Pydantic model
 
+# Project root (/workspace/ or /home/.../website-rag/), resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# On-disk cache of judge results, keyed by a hash of the model and graded content.
+# Anchored to the project root so every working directory shares one cache
+JUDGE_CACHE_DIR = str(PROJECT_ROOT / ".cache" / "judge")
+# Part of the cache key: bump whenever the grading prompt or the overall_quality
+# weighting / hallucination penalty in evaluate_answer changes, so old scores aren't reused
+JUDGE_PROMPT_VERSION = 1
+
 class AIJudge:
     """
     AI-as-Judge evaluator that scores answers on absolute quality.
     """
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-opus-20240229"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-opus-20240229",
+                 cache_dir: Optional[str] = JUDGE_CACHE_DIR):
         """
         Initialize AI Judge
+        cache_dir: where judge results are cached across runs (None disables caching)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
             print("Warning: ANTHROPIC_API_KEY not found for AIJudge")
         self.client = Anthropic(api_key=self.api_key)
         self.model = model
+        self.cache_dir = cache_dir
+        self.cache_hits = 0
+
+    def _cache_path(self, question: str, system_answer: str, system_sources: List[str]) -> str:
+        """Content-addressed cache file for one (prompt version, model, question, answer, sources) judgement"""
+        key_material = "\x00".join([str(JUDGE_PROMPT_VERSION), self.model, question, system_answer,
+                                    *map(str, system_sources)])
+        key = hashlib.blake2b(key_material.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
 
     def evaluate_answer(
         self,
@@ -48,6 +71,17 @@ class AIJudge:
         Evaluate answer quality using AI judge.
         """
         
+        cache_path = None
+        if self.cache_dir:
+            cache_path = self._cache_path(question, system_answer, system_sources or [])
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached = JudgeResult.model_validate_json(f.read())
+                self.cache_hits += 1
+                return cached
+            except (OSError, ValidationError):
+                pass
+
         sources_text = "\n".join(f"- {src}" for src in system_sources) if system_sources else "No sources provided"
 
         prompt = f"""You are an expert evaluator grading an AI Support Agent's response.
@@ -113,6 +147,15 @@ Respond ONLY with a valid JSON object:
                 if judge_result.hallucination:
                     judge_result.overall_quality *= 0.5 # Severe penalty
 
+                # Cache successful judgements only; failures should be retried on the next run
+                if cache_path:
+                    try:
+                        os.makedirs(self.cache_dir, exist_ok=True)
+                        with open(cache_path, 'w') as f:
+                            f.write(judge_result.model_dump_json())
+                    except OSError as e:
+                        print(f"   Warning: Could not cache judge result: {e}")
+
                 return judge_result
 
             except (ValueError, ValidationError, Exception) as e: # Catch Pydantic validation errors
@@ -129,52 +172,67 @@ Respond ONLY with a valid JSON object:
     def evaluate_batch(self, results_file: str, output_file: str):
         """
         Evaluate a batch of system results.
+        results_file may be a JSON array (results_*.json) or NDJSON with one result
+        per line (*.jsonl, e.g. the partial log left by an interrupted run).
         """
         print(f"📖 Loading system results from {results_file}...")
-        with open(results_file) as f:
-            system_results = json.load(f)
+        with open(results_file, 'rb') as f:
+            if results_file.endswith(".jsonl"):
+                system_results = [orjson.loads(line) for line in f if line.strip()]
+            else:
+                system_results = orjson.loads(f.read())
 
         evaluations = []
+        # Each evaluation is also appended here as it completes, so a crashed run keeps its work.
+        # Truncated at the start of every batch so a rerun to the same output never mixes in
+        # stale records from an earlier run
+        partial_file = Path(output_file).with_suffix(".jsonl")
+        with open(partial_file, 'wb') as partial:
+            for i, result in enumerate(system_results, 1):
+                q_id = result["question_id"]
+                print(f"\n[{i}/{len(system_results)}] Evaluating {q_id}...")
+                hits_before = self.cache_hits
+
+                evaluation = self.evaluate_answer(
+                    question=result["question"],
+                    system_answer=result["answer"],
+                    system_sources=result.get("sources", [])
+                )
 
-        for i, result in enumerate(system_results, 1):
-            q_id = result["question_id"]
-            print(f"\n[{i}/{len(system_results)}] Evaluating {q_id}...")
-
-            evaluation = self.evaluate_answer(
-                question=result["question"],
-                system_answer=result["answer"],
-                system_sources=result.get("sources", [])
-            )
-
-            # Convert JudgeResult Pydantic model to dict for JSON serialization
-            evaluation_dict = evaluation.model_dump()
+                # Convert JudgeResult Pydantic model to dict for JSON serialization
+                evaluation_dict = evaluation.model_dump()
             
-            # Add metadata
-            evaluation_dict["question_id"] = q_id
-            evaluation_dict["question"] = result["question"]
+                # Add metadata
+                evaluation_dict["question_id"] = q_id
+                evaluation_dict["question"] = result["question"]
             
-            # Determine verdict based on score
-            score = evaluation.overall_quality # Access attribute directly
-            if evaluation.hallucination: # Access attribute directly
-                verdict = "HALLUCINATION"
-            elif score >= 80:
-                verdict = "EXCELLENT"
-            elif score >= 60:
-                verdict = "GOOD"
-            elif score >= 40:
-                verdict = "FAIR"
-            else:
-                verdict = "POOR"
+                # Determine verdict based on score
+                score = evaluation.overall_quality # Access attribute directly
+                if evaluation.hallucination: # Access attribute directly
+                    verdict = "HALLUCINATION"
+                elif score >= 80:
+                    verdict = "EXCELLENT"
+                elif score >= 60:
+                    verdict = "GOOD"
+                elif score >= 40:
+                    verdict = "FAIR"
+                else:
+                    verdict = "POOR"
             
-            evaluation_dict["verdict"] = verdict
-            evaluations.append(evaluation_dict)
+                evaluation_dict["verdict"] = verdict
+                evaluations.append(evaluation_dict)
+                partial.write(orjson.dumps(evaluation_dict) + b"\n")
+                partial.flush()
 
-            print(f"   Score: {score:.1f}/100 ({verdict})")
-            # Rate limiting
-            time.sleep(1)
+                if self.cache_hits > hits_before:
+                    print(f"   Score: {score:.1f}/100 ({verdict}) [cached]")
+                else:
+                    print(f"   Score: {score:.1f}/100 ({verdict})")
+                    # Rate limiting (only needed after a real API call)
+                    time.sleep(1)
 
         # Save evaluations
-        with open(output_file, 'w') as f:
-            json.dump(evaluations, f, indent=2)
+        Path(output_file).write_bytes(orjson.dumps(evaluations, option=orjson.OPT_INDENT_2))
+        partial_file.unlink(missing_ok=True)
 
         print(f"\n✅ Evaluation complete! Saved to {output_file}")
\ No newline at end of file
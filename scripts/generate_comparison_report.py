@@ -3,67 +3,279 @@ Generate comprehensive benchmark results report with LLM-powered insights.
 Creates RESULTS.md with detailed breakdowns and AI-generated analysis.
 Aggregates Quality (from eval_*.json) and Performance (from results_*.json).
 """
-import glob
-import json
+import argparse
+import hashlib
+import heapq
 import os
 import time
-from collections import defaultdict
-from anthropic import Anthropic
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from pathlib import Path
+
+import numpy as np
+import orjson
+
+QUALITY_FIELDS = ("overall_quality", "accuracy", "completeness", "clarity", "helpfulness")
+PERFORMANCE_FIELDS = ("total_time", "search_time", "gen_time", "search_cost", "gen_cost")
+# Below this many records the plain Python loop beats NumPy's call overhead
+NUMPY_MIN_RECORDS = 256
+HALLUCINATION_VERDICT = "HALLUCINATION"
+# AI judge records always carry these keys; fetch them in one C-level call
+_EVAL_GETTER = itemgetter(*QUALITY_FIELDS, "hallucination", "verdict")
+# Shared read-only fallback for records without a "metrics" dict
+_EMPTY: dict = {}
+
+# Score ease of adoption (manual scoring based on known characteristics)
+ADOPTION_SCORES = {
+    'jina_claude': 95,     # 5min setup, free tier, excellent docs, production ready
+    'jina_gpt4': 95,       # Same as above
+    'tavily_claude': 85,   # 10min setup, paid only, excellent docs, production ready
+    'tavily_gpt4': 85,     # Same as above
+    'firecrawl_claude': 80,  # 10min setup, paid only, good docs, beta
+    'firecrawl_gpt4': 80,    # Same as above
+    '_archive': 0
+}
+
+# Score maturity (manual scoring)
+MATURITY_SCORES = {
+    'jina_claude': 95,     # Production, high stability
+    'jina_gpt4': 95,       # Production, high stability
+    'tavily_claude': 95,   # Production, high stability
+    'tavily_gpt4': 95,     # Production, high stability
+    'firecrawl_claude': 75,  # Beta, medium stability
+    'firecrawl_gpt4': 75,    # Beta, medium stability
+    '_archive': 0
+}
+
+# Sidecar manifest (inside results_dir) of parsed result files, so unchanged files are not re-parsed
+MANIFEST_FILE = ".manifest.json"
+MANIFEST_DATA_FILE = ".manifest.data.json"
+
+# Project root (/workspace/ or /home/.../website-rag/), resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# On-disk cache for LLM insights, keyed by a hash of the prompt version, model and benchmark
+# data. Anchored to the project root so every working directory shares one cache
+INSIGHTS_CACHE_DIR = str(PROJECT_ROOT / ".cache")
+INSIGHTS_MODEL = "claude-3-opus-20240229"
+# Bump whenever the insights prompt in generate_llm_insights changes, so old insights aren't reused
+INSIGHTS_PROMPT_VERSION = 1
+
+# Fingerprint (inside results_dir) of the data behind the last generated report
+LAST_REPORT_HASH_FILE = ".last_report_hash"
+
+# Quick-comparison indicators: star for the top rank; hallucination count 0 / 1-4 / 5+
+RANK_INDICATORS = {1: " ⭐"}
+ERROR_INDICATORS = (" ✅",) + (" ⚠️",) * 4 + (" ❌",)
+
+# Row templates for the per-combination breakdown tables
+PERF_ROW_TMPL = "| {k} | {v} |\n"
+QUESTION_ROW_TMPL = "| {qid} | {qual:.1f} | {acc:.1f} | {text} |\n"
+
+# Per-combination heading and quality breakdown, formatted once per combo via format_map
+QUALITY_DETAIL_TMPL = (
+    "### {rank}. {name_upper}\n\n"
+    "#### Quality Score Calculation\n\n"
+    "**Formula:** `Overall = (Accuracy × 0.25) + (Completeness × 0.25) + (Clarity × 0.25) + (Helpfulness × 0.25)`\n\n"
+    "**Calculation:** `{overall:.1f} = ({acc:.1f} × 0.25) + ({comp:.1f} × 0.25) + ({clar:.1f} × 0.25) + ({help_score:.1f} × 0.25)`\n\n"
+    "| Component | Score | Weight | Contribution |\n"
+    "|-----------|-------|--------|--------------|\n"
+    "| Accuracy | {acc:.1f} | 25% | {acc_w:.1f} |\n"
+    "| Completeness | {comp:.1f} | 25% | {comp_w:.1f} |\n"
+    "| Clarity | {clar:.1f} | 25% | {clar_w:.1f} |\n"
+    "| Helpfulness | {help_score:.1f} | 25% | {help_w:.1f} |\n"
+    "| **Overall Quality** | **{overall:.1f}** | 100% | - |\n\n"
+    "**How These Scores Are Calculated:**\n\n"
+    "1. AI Judge (Claude Opus 3) evaluates each of the 25 test questions\n"
+    "2. For each question, scores Accuracy, Completeness, Clarity, and Helpfulness (0-100)\n"
+    "3. Each component score above is the **average across all 25 questions**\n"
+    "4. Overall Quality is the weighted average using the formula above\n\n"
+)
+
+# Static report sections, written verbatim
+RUBRIC_SECTION = (
+    "## 📋 Evaluation Rubric\n\n"
+    "Our framework evaluates each combination across five equally important dimensions (20% each):\n\n"
+    "| Dimension | Key Metrics | Description |\n"
+    "|-----------|-------------|-------------|\n"
+    "| **Accuracy & Quality** | Quality Score, Hallucination Rate | Factual correctness and answer completeness |\n"
+    "| **Latency** | Total Response Time, Search Time, Generation Time | End-to-end speed and performance |\n"
+    "| **Operational Cost** | Cost per Query, Cost at Scale | Direct API costs (search + LLM) |\n"
+    "| **Ease of Adoption** | Setup Time, Documentation, API Access | Implementation complexity |\n"
+    "| **Maturity** | Stability, Feature Coverage, Support | Production readiness |\n\n"
+    "*All dimensions weighted equally at 20% - they are all necessary and important for production use.*\n\n"
+    "---\n\n"
+)
+QUESTION_TABLE_HEADER = (
+    "| Q ID | Quality | Accuracy | Question |\n"
+    "|------|---------|----------|----------|\n"
+)
+
+def load_manifest(results_dir: str) -> dict:
+    """
+    Load the sidecar manifest of previously parsed result files.
+    Returns {"files": {combo: {prefix: {path, mtime, size}}}, "data": {path: parsed}},
+    or an empty manifest if none exists or it cannot be read.
+    Both files are plain JSON, so a file dropped into results_dir can't run code.
+    """
+    try:
+        with open(os.path.join(results_dir, MANIFEST_FILE), 'rb') as f:
+            files = orjson.loads(f.read())
+        with open(os.path.join(results_dir, MANIFEST_DATA_FILE), 'rb') as f:
+            data = orjson.loads(f.read())
+    except FileNotFoundError:
+        return {"files": {}, "data": {}}
+    except (OSError, orjson.JSONDecodeError) as e:
+        print(f"Warning: Could not read results manifest, re-parsing all files: {e}")
+        return {"files": {}, "data": {}}
+    if not (isinstance(files, dict) and isinstance(data, dict)):
+        print("Warning: Results manifest is malformed, re-parsing all files")
+        return {"files": {}, "data": {}}
+    return {"files": files, "data": data}
+
+def save_manifest(results_dir: str, manifest: dict):
+    """Write the manifest back, keeping parsed data only for files still referenced"""
+    live_paths = {
+        entry["path"]
+        for prefixes in manifest["files"].values()
+        for entry in prefixes.values()
+    }
+    data = {path: parsed for path, parsed in manifest["data"].items() if path in live_paths}
 
-def load_json_files(results_dir: str, prefix: str) -> dict:
+    try:
+        with open(os.path.join(results_dir, MANIFEST_FILE), 'wb') as f:
+            f.write(orjson.dumps(manifest["files"], option=orjson.OPT_INDENT_2))
+        with open(os.path.join(results_dir, MANIFEST_DATA_FILE), 'wb') as f:
+            f.write(orjson.dumps(data))
+    except OSError as e:
+        print(f"Warning: Could not write results manifest: {e}")
+
+def load_json_files(results_dir: str, prefix: str, manifest: dict = None) -> dict:
     """
     Load only the LATEST JSON file per combination matching a prefix (eval_ or results_)
     grouped by combination name. Uses file modification time to identify latest.
+    If a manifest is given, files whose mtime and size are unchanged are taken from it
+    instead of being re-parsed, and newly parsed files are recorded in it.
     """
-    pattern = f"{results_dir}/*/{prefix}*.json"
-    files = glob.glob(pattern)
-
-    # Group files by combination name and track latest file per combo
-    combo_files = defaultdict(list)
-
-    for filepath in files:
-        parts = filepath.split("/")
-        if len(parts) >= 2:
-            combo_name = parts[-2]
-            # Get file modification time
-            mtime = os.path.getmtime(filepath)
-            combo_files[combo_name].append((mtime, filepath))
+    # Track the latest (mtime, filepath, size) per combination in a single pass
+    combo_latest: dict[str, tuple[float, str, int]] = {}
+
+    with os.scandir(results_dir) as combo_entries:
+        for combo_entry in combo_entries:
+            if not combo_entry.is_dir():
+                continue
+            combo_name = combo_entry.name
+
+            with os.scandir(combo_entry.path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith(prefix) and name.endswith(".json")):
+                        continue
+                    stat = entry.stat()
+                    cur = combo_latest.get(combo_name)
+                    # Ties on mtime go to the later path (timestamped names sort by run time)
+                    if cur is None or (stat.st_mtime, entry.path) > cur[:2]:
+                        combo_latest[combo_name] = (stat.st_mtime, entry.path, stat.st_size)
+
+    grouped_data = {}
+
+    # Reuse parsed data for files the manifest has already seen unchanged
+    pending = {}
+    for combo_name, (mtime, filepath, size) in combo_latest.items():
+        known = manifest["files"].get(combo_name, {}).get(prefix) if manifest else None
+        if known == {"path": filepath, "mtime": mtime, "size": size} and filepath in manifest["data"]:
+            grouped_data[combo_name] = manifest["data"][filepath]
+            print(f"✓ Loaded latest {prefix} file for {combo_name}: {os.path.basename(filepath)} (unchanged)")
+        else:
+            pending[combo_name] = (mtime, filepath, size)
 
-    # Load only the latest file per combination
-    grouped_data = defaultdict(list)
+    # Load only the latest file per combination (reads overlap across threads)
+    if not pending:
+        return grouped_data
 
-    for combo_name, file_list in combo_files.items():
-        # Sort by modification time and get the latest file
-        file_list.sort(reverse=True)  # Most recent first
-        latest_mtime, latest_filepath = file_list[0]
+    with ThreadPoolExecutor(max_workers=min(32, len(pending))) as executor:
+        loaded = executor.map(_read_latest, pending.items())
 
-        try:
-            with open(latest_filepath, 'r') as f:
-                data = json.load(f)
-                grouped_data[combo_name].extend(data if isinstance(data, list) else [data])
+        for combo_name, latest_filepath, data, error in loaded:
+            if error is not None:
+                print(f"Warning: Could not load {latest_filepath}: {error}")
+                continue
+            grouped_data[combo_name] = data if isinstance(data, list) else [data]
             print(f"✓ Loaded latest {prefix} file for {combo_name}: {os.path.basename(latest_filepath)}")
-        except Exception as e:
-            print(f"Warning: Could not load {latest_filepath}: {e}")
+
+            if manifest is not None:
+                mtime, _, size = pending[combo_name]
+                manifest["files"].setdefault(combo_name, {})[prefix] = {
+                    "path": latest_filepath, "mtime": mtime, "size": size
+                }
+                manifest["data"][latest_filepath] = grouped_data[combo_name]
 
     return grouped_data
 
+def _read_latest(item: tuple) -> tuple:
+    """Read one (combo_name, (mtime, filepath, size)) entry; errors are returned, not raised"""
+    combo_name, (_, filepath, _) = item
+    try:
+        with open(filepath, 'rb') as f:
+            return combo_name, filepath, orjson.loads(f.read()), None
+    except Exception as e:
+        return combo_name, filepath, None, e
+
 def calculate_quality_metrics(evaluations: list) -> dict:
     """Calculate aggregated quality metrics"""
     if not evaluations:
         return {}
         
     count = len(evaluations)
-    
-    # Averages
-    avg_score = sum(e.get("overall_quality", 0) for e in evaluations) / count
-    avg_accuracy = sum(e.get("accuracy", 0) for e in evaluations) / count
-    avg_completeness = sum(e.get("completeness", 0) for e in evaluations) / count
-    avg_clarity = sum(e.get("clarity", 0) for e in evaluations) / count
-    avg_helpfulness = sum(e.get("helpfulness", 0) for e in evaluations) / count
-    
-    # Counts
-    hallucinations = sum(1 for e in evaluations if e.get("hallucination") or e.get("verdict") == "HALLUCINATION")
+
+    if count >= NUMPY_MIN_RECORDS:
+        return _quality_metrics_numpy(evaluations)
+
+    # Single pass over evaluations for all sums and counts
+    acc_score = acc_accuracy = acc_completeness = acc_clarity = acc_helpfulness = 0
+    hallucinations = 0
+    for e in evaluations:
+        try:
+            score, accuracy, completeness, clarity, helpfulness, halluc, verdict = _EVAL_GETTER(e)
+        except KeyError:
+            # Sparse record (e.g. hand-edited or older judge output)
+            get = e.get
+            score, accuracy, completeness, clarity, helpfulness = (get(f, 0) for f in QUALITY_FIELDS)
+            halluc, verdict = get("hallucination"), get("verdict")
+        acc_score += score
+        acc_accuracy += accuracy
+        acc_completeness += completeness
+        acc_clarity += clarity
+        acc_helpfulness += helpfulness
+        if halluc or verdict == HALLUCINATION_VERDICT:
+            hallucinations += 1
     
+    return {
+        "quality_score": acc_score / count,
+        "accuracy": acc_accuracy / count,
+        "completeness": acc_completeness / count,
+        "clarity": acc_clarity / count,
+        "helpfulness": acc_helpfulness / count,
+        "hallucinations": hallucinations,
+        "total_evaluated": count
+    }
+
+def _stack_fields(records: list, fields: tuple) -> np.ndarray:
+    """Build an (N, len(fields)) float64 matrix from a list of dicts (2+ fields), missing fields as 0"""
+    try:
+        # Complete records: one C-level itemgetter tuple per record
+        return np.array(list(map(itemgetter(*fields), records)), dtype=np.float64)
+    except KeyError:
+        return np.array([[r.get(f, 0) for f in fields] for r in records], dtype=np.float64)
+
+def _quality_metrics_numpy(evaluations: list) -> dict:
+    """Vectorized variant of calculate_quality_metrics for large evaluation sets"""
+    means = _stack_fields(evaluations, QUALITY_FIELDS).mean(axis=0)
+    verdicts = np.array([e.get("verdict") for e in evaluations], dtype=object)
+    halluc_flags = np.array([bool(e.get("hallucination")) for e in evaluations], dtype=bool)
+    hallucinations = int(np.count_nonzero((verdicts == HALLUCINATION_VERDICT) | halluc_flags))
+
+    avg_score, avg_accuracy, avg_completeness, avg_clarity, avg_helpfulness = means.tolist()
     return {
         "quality_score": avg_score,
         "accuracy": avg_accuracy,
@@ -71,7 +283,7 @@ def calculate_quality_metrics(evaluations: list) -> dict:
         "clarity": avg_clarity,
         "helpfulness": avg_helpfulness,
         "hallucinations": hallucinations,
-        "total_evaluated": count
+        "total_evaluated": len(evaluations)
     }
 
 def calculate_performance_metrics(results: list) -> dict:
@@ -81,45 +293,140 @@ def calculate_performance_metrics(results: list) -> dict:
 
     count = len(results)
 
-    # Averages (some old result files might miss fields, use .get with 0)
-    avg_total_time = sum(r.get("metrics", {}).get("total_time", 0) for r in results) / count
-    avg_search_time = sum(r.get("metrics", {}).get("search_time", 0) for r in results) / count
-    avg_gen_time = sum(r.get("metrics", {}).get("gen_time", 0) for r in results) / count
+    if count >= NUMPY_MIN_RECORDS:
+        return _performance_metrics_numpy(results)
 
-    # Costs
-    avg_total_cost = sum(
-        r.get("metrics", {}).get("search_cost", 0) + r.get("metrics", {}).get("gen_cost", 0)
-        for r in results
-    ) / count
+    # Single pass (some old result files might miss fields, use .get with 0)
+    acc_total_time = acc_search_time = acc_gen_time = acc_total_cost = 0
+    for r in results:
+        m = r.get("metrics") or _EMPTY
+        acc_total_time += m.get("total_time", 0)
+        acc_search_time += m.get("search_time", 0)
+        acc_gen_time += m.get("gen_time", 0)
+        acc_total_cost += m.get("search_cost", 0) + m.get("gen_cost", 0)
 
+    return {
+        "total_time": acc_total_time / count,
+        "search_time": acc_search_time / count,
+        "gen_time": acc_gen_time / count,
+        "total_cost": acc_total_cost / count,
+        "total_runs": count
+    }
+
+def _performance_metrics_numpy(results: list) -> dict:
+    """Vectorized variant of calculate_performance_metrics for large result sets"""
+    metrics = [r.get("metrics") or _EMPTY for r in results]
+    avg_total_time, avg_search_time, avg_gen_time, avg_search_cost, avg_gen_cost = (
+        _stack_fields(metrics, PERFORMANCE_FIELDS).mean(axis=0).tolist()
+    )
     return {
         "total_time": avg_total_time,
         "search_time": avg_search_time,
         "gen_time": avg_gen_time,
-        "total_cost": avg_total_cost,
-        "total_runs": count
+        "total_cost": avg_search_cost + avg_gen_cost,
+        "total_runs": len(results)
+    }
+
+def _question_row(q: dict) -> dict:
+    """Fields for one QUESTION_ROW_TMPL row, with the question text truncated to 60 chars"""
+    text = q.get('question', 'N/A')
+    return {
+        "qid": q.get('question_id', 'N/A'),
+        "qual": q.get('overall_quality', 0),
+        "acc": q.get('accuracy', 0),
+        "text": text[:60] + "..." if len(text) > 60 else text
     }
 
+def sort_by_keys(items: list, keys: list, reverse: bool = False) -> list:
+    """
+    Return items ordered by a parallel list of precomputed keys.
+    Sorting indices with keys.__getitem__ keeps the key fetch in C; like sorted(), it is stable.
+    """
+    order = sorted(range(len(items)), key=keys.__getitem__, reverse=reverse)
+    return [items[i] for i in order]
+
+def _overall_quality(e: dict):
+    return e.get('overall_quality', 0)
+
+def _smallest_indices(keys: np.ndarray, n: int) -> list:
+    """Indices of the n smallest keys, ascending, ties in original order (like heapq.nsmallest)"""
+    if len(keys) > n:
+        # Partition for the n-th smallest value, then keep every index at or below it
+        # (all boundary ties, in index order) so the stable sort can pick the earliest
+        threshold = np.partition(keys, n - 1)[n - 1]
+        candidates = np.flatnonzero(keys <= threshold)
+    else:
+        candidates = np.arange(len(keys))
+    return candidates[np.argsort(keys[candidates], kind="stable")][:n].tolist()
+
+def extreme_questions(evaluations: list, n: int = 5) -> tuple:
+    """Return (best n, worst n) evaluations by overall_quality, matching heapq.nlargest/nsmallest"""
+    if len(evaluations) < NUMPY_MIN_RECORDS:
+        return (heapq.nlargest(n, evaluations, key=_overall_quality),
+                heapq.nsmallest(n, evaluations, key=_overall_quality))
+
+    scores = np.array([e.get('overall_quality', 0) for e in evaluations], dtype=np.float64)
+    best = [evaluations[i] for i in _smallest_indices(-scores, n)]
+    worst = [evaluations[i] for i in _smallest_indices(scores, n)]
+    return best, worst
+
+def report_fingerprint(summary_data: list, cache_data: dict, insights_cached: bool) -> str:
+    """
+    Hash everything the report is rendered from, so unchanged inputs can be detected.
+    Whether real LLM insights exist is part of it, so a report rendered with the
+    fallback text is regenerated once insights become available.
+    """
+    payload = orjson.dumps([summary_data, cache_data, insights_cached], option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def _insights_data_summary(summary_data: list) -> bytes:
+    """Benchmark data sent to the LLM for insights (also the insights cache key material)"""
+    return orjson.dumps([
+        {
+            "combination": s["name"],
+            "quality": s.get("quality_score", 0),
+            "accuracy": s.get("accuracy", 0),
+            "completeness": s.get("completeness", 0),
+            "clarity": s.get("clarity", 0),
+            "helpfulness": s.get("helpfulness", 0),
+            "hallucinations": s.get("hallucinations", 0),
+            "latency": s.get("total_time", 0),
+            "cost_per_query": s.get("total_cost", 0)
+        }
+        for s in summary_data
+    ], option=orjson.OPT_INDENT_2)
+
+def insights_cache_path(summary_data: list) -> str:
+    """Cache file holding the LLM insights for this benchmark data"""
+    key_material = f"{INSIGHTS_PROMPT_VERSION}\x00{INSIGHTS_MODEL}\x00".encode() + _insights_data_summary(summary_data)
+    cache_key = hashlib.blake2b(key_material, digest_size=16).hexdigest()
+    return os.path.join(INSIGHTS_CACHE_DIR, f"insights_{cache_key}.txt")
+
 def generate_llm_insights(summary_data: list) -> str:
-    """Use LLM to generate insights and analysis of benchmark results"""
+    """
+    Use LLM to generate insights and analysis of benchmark results.
+    Responses are cached on disk per benchmark-data hash, so re-running the
+    report on unchanged results skips the API call.
+    """
+    # Prepare data summary for LLM
+    data_summary_bytes = _insights_data_summary(summary_data)
+
+    cache_path = insights_cache_path(summary_data)
+    if os.path.exists(cache_path):
+        print(f"✓ Using cached LLM insights: {cache_path}")
+        with open(cache_path, 'r') as f:
+            return f.read()
+
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        return "*LLM-powered insights unavailable (API key not configured)*"
+
     try:
-        client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-
-        # Prepare data summary for LLM
-        data_summary = json.dumps([
-            {
-                "combination": s["name"],
-                "quality": s.get("quality_score", 0),
-                "accuracy": s.get("accuracy", 0),
-                "completeness": s.get("completeness", 0),
-                "clarity": s.get("clarity", 0),
-                "helpfulness": s.get("helpfulness", 0),
-                "hallucinations": s.get("hallucinations", 0),
-                "latency": s.get("total_time", 0),
-                "cost_per_query": s.get("total_cost", 0)
-            }
-            for s in summary_data
-        ], indent=2)
+        # Deferred so runs without a key never import the SDK
+        from anthropic import Anthropic
+
+        client = Anthropic(api_key=api_key)
+        data_summary = data_summary_bytes.decode()
 
         prompt = f"""You are a technical analyst reviewing benchmark results for RAG (Retrieval-Augmented Generation) systems.
 
@@ -138,18 +445,34 @@ Analyze these results and provide:
 Be specific, data-driven, and provide actionable insights. Keep it concise (300-400 words)."""
 
         response = client.messages.create(
-            model="claude-3-opus-20240229",
+            model=INSIGHTS_MODEL,
             max_tokens=2000,
             messages=[{"role": "user", "content": prompt}]
         )
 
-        return response.content[0].text.strip()
+        insights = response.content[0].text.strip()
 
     except Exception as e:
         print(f"⚠️  Could not generate LLM insights: {e}")
         return "*LLM-powered insights unavailable (API key not configured or request failed)*"
 
+    try:
+        os.makedirs(INSIGHTS_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'w') as f:
+            f.write(insights)
+    except OSError as e:
+        print(f"Warning: Could not cache LLM insights: {e}")
+
+    return insights
+
 def main():
+    parser = argparse.ArgumentParser(description="Generate benchmark comparison report")
+    parser.add_argument("--emit-json", action="store_true",
+                        help="Also write the per-combination summary as JSON next to the timestamped report")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate the report even if the results are unchanged since the last run")
+    args = parser.parse_args()
+
     results_dir = "test_results"
 
     if not os.path.exists(results_dir):
@@ -158,12 +481,14 @@ def main():
 
     print(f"📖 Loading results from {results_dir}...")
 
+    manifest = load_manifest(results_dir)
+
     # Load Quality Data
-    eval_data = load_json_files(results_dir, "eval_")
+    eval_data = load_json_files(results_dir, "eval_", manifest)
     # Load Performance Data
-    perf_data = load_json_files(results_dir, "results_")
+    perf_data = load_json_files(results_dir, "results_", manifest)
     # Load Cache Statistics (if available)
-    cache_data = load_json_files(results_dir, "cache_stats_")
+    cache_data = load_json_files(results_dir, "cache_stats_", manifest)
 
     if not eval_data and not perf_data:
         print("❌ No results found.")
@@ -173,355 +498,371 @@ def main():
     summary = []
     all_combos = set(eval_data.keys()) | set(perf_data.keys())
 
-    for combo in all_combos:
+    for combo in sorted(all_combos):
         q_metrics = calculate_quality_metrics(eval_data.get(combo, []))
         p_metrics = calculate_performance_metrics(perf_data.get(combo, []))
 
-        # Merge all metrics
-        full_metrics = {"name": combo, **q_metrics, **p_metrics}
+        # Merge all metrics; run_evaluation names combo dirs "{mcp}_{llm}", so tag both once here
+        tool, _, llm = combo.partition("_")
+        full_metrics = {"name": combo, "tool": tool, "llm": llm, **q_metrics, **p_metrics}
         summary.append(full_metrics)
 
+    # Fill defaults and manual adoption/maturity scores once, so sorts can use itemgetter
+    for s in summary:
+        s.setdefault('quality_score', 0)
+        s['adoption_score'] = ADOPTION_SCORES.get(s['name'], 0)
+        s['maturity_score'] = MATURITY_SCORES.get(s['name'], 0)
+
     # Sort by Quality Score (default)
-    summary.sort(key=lambda x: x.get("quality_score", 0), reverse=True)
+    summary.sort(key=itemgetter('quality_score'), reverse=True)
 
     # Calculate rankings for each dimension
     def get_rankings(summary_data):
-        """Calculate rankings for each KPI dimension"""
-        rankings = {
-            'quality': sorted(summary_data, key=lambda x: x.get('quality_score', 0), reverse=True),
-            'speed': sorted(summary_data, key=lambda x: x.get('total_time', float('inf'))),
-            'cost': sorted(summary_data, key=lambda x: x.get('total_cost', float('inf'))),
+        """Calculate rankings for each KPI dimension (summary_data is already quality-sorted)"""
+        # Time/cost are not defaulted in the summary (a missing value would render as "inf"),
+        # so their keys carry the inf default only for sorting
+        inf = float('inf')
+        return {
+            'quality': summary_data,
+            'speed': sort_by_keys(summary_data, [s.get('total_time', inf) for s in summary_data]),
+            'cost': sort_by_keys(summary_data, [s.get('total_cost', inf) for s in summary_data]),
+            'adoption': sorted(summary_data, key=itemgetter('adoption_score'), reverse=True),
+            'maturity': sorted(summary_data, key=itemgetter('maturity_score'), reverse=True),
         }
 
-        # Score ease of adoption (manual scoring based on known characteristics)
-        adoption_scores = {
-            'jina_claude': 95,     # 5min setup, free tier, excellent docs, production ready
-            'jina_gpt4': 95,       # Same as above
-            'tavily_claude': 85,   # 10min setup, paid only, excellent docs, production ready
-            'tavily_gpt4': 85,     # Same as above
-            'firecrawl_claude': 80,  # 10min setup, paid only, good docs, beta
-            'firecrawl_gpt4': 80,    # Same as above
-            '_archive': 0
-        }
+    def emit_json(json_path):
+        json_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+        print(f"✅ JSON summary saved to: {json_path}")
 
-        # Score maturity (manual scoring)
-        maturity_scores = {
-            'jina_claude': 95,     # Production, high stability
-            'jina_gpt4': 95,       # Production, high stability
-            'tavily_claude': 95,   # Production, high stability
-            'tavily_gpt4': 95,     # Production, high stability
-            'firecrawl_claude': 75,  # Beta, medium stability
-            'firecrawl_gpt4': 75,    # Beta, medium stability
-            '_archive': 0
-        }
-
-        # Add scores to summary
-        for s in summary_data:
-            s['adoption_score'] = adoption_scores.get(s['name'], 0)
-            s['maturity_score'] = maturity_scores.get(s['name'], 0)
-
-        rankings['adoption'] = sorted(summary_data, key=lambda x: x.get('adoption_score', 0), reverse=True)
-        rankings['maturity'] = sorted(summary_data, key=lambda x: x.get('maturity_score', 0), reverse=True)
-
-        return rankings
+    # Skip regeneration entirely when nothing changed since the last report. Only a report
+    # built with real (cached) LLM insights counts, never one with the fallback text
+    insights_path = insights_cache_path(summary)
+    fingerprint = report_fingerprint(summary, cache_data, os.path.exists(insights_path))
+    hash_path = os.path.join(results_dir, LAST_REPORT_HASH_FILE)
+    if not args.force and os.path.exists("RESULTS.md") and os.path.exists(insights_path):
+        try:
+            with open(hash_path, 'r') as f:
+                unchanged = f.read().strip() == fingerprint
+        except OSError:
+            unchanged = False
+        if unchanged:
+            print("✓ Results unchanged since the last report; RESULTS.md is up to date (use --force to regenerate)")
+            if args.emit_json:
+                emit_json(Path(results_dir) / f"benchmark_report_{time.strftime('%Y%m%d-%H%M%S')}.json")
+            save_manifest(results_dir, manifest)
+            return
 
     rankings = get_rankings(summary)
 
+    # Combinations shown in the report (archived runs excluded), with per-LLM-vendor
+    # [combos, quality sum, hallucinations] totals accumulated in the same pass
+    non_archive = []
+    vendor_totals = {'claude': [0, 0, 0], 'gpt4': [0, 0, 0]}
+    for s in summary:
+        if s['name'] == '_archive':
+            continue
+        non_archive.append(s)
+        totals = vendor_totals.get(s['llm'])
+        if totals is not None:
+            totals[0] += 1
+            totals[1] += s['quality_score']
+            totals[2] += s.get('hallucinations', 0)
+
     print("🤖 Generating LLM-powered insights...")
     llm_insights = generate_llm_insights(summary)
 
     # Generate Comprehensive RESULTS.md
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-    lines = []
-
-    # Header
-    lines.append("# Benchmark Results & Analysis\n")
-    lines.append(f"**Last Updated:** {timestamp}")
-    lines.append(f"**Questions Tested:** {summary[0].get('total_evaluated', 25) if summary else 25}")
-    lines.append(f"**Combinations Tested:** {len([s for s in summary if s['name'] != '_archive'])}\n")
-
-    # Executive Summary - THE ANSWER
-    lines.append("---\n")
-    lines.append("## 🎯 Executive Summary: Recommendation\n")
-
-    # Get the winners
-    best_quality = rankings['quality'][0] if rankings['quality'] else None
-    best_speed = rankings['speed'][0] if rankings['speed'] else None
-    best_cost = rankings['cost'][0] if rankings['cost'] else None
-
-    if best_quality and best_quality['name'] != '_archive':
-        lines.append(f"### ✅ **RECOMMENDED: {best_quality['name'].upper()}**\n")
-        lines.append(f"**Quality:** {best_quality.get('quality_score', 0):.1f}/100 (highest)")
-        lines.append(f"**Hallucinations:** {best_quality.get('hallucinations', 0)} (out of 25 questions)")
-        lines.append(f"**Cost:** ${best_quality.get('total_cost', 0):.4f}/query (${best_quality.get('total_cost', 0) * 100000:.0f} per 100K queries)")
-        lines.append(f"**Speed:** {best_quality.get('total_time', 0):.2f}s average response time\n")
-
-        # When to switch
-        if best_cost and best_cost['name'] != best_quality['name'] and best_cost['name'] != '_archive':
-            cost_savings = (best_quality.get('total_cost', 0) - best_cost.get('total_cost', 0)) * 100000
-            quality_diff = best_quality.get('quality_score', 0) - best_cost.get('quality_score', 0)
-            lines.append(f"**Switch to {best_cost['name']} if:** Processing >100K queries/month (saves ${cost_savings:.0f}/month, quality drops {quality_diff:.1f} points)\n")
-
-        if best_speed and best_speed['name'] != best_quality['name'] and best_speed['name'] != '_archive':
-            speed_gain = best_quality.get('total_time', 0) - best_speed.get('total_time', 0)
-            speed_halluc = best_speed.get('hallucinations', 0)
-            lines.append(f"**Switch to {best_speed['name']} if:** Must have <7s response AND can tolerate {speed_halluc} hallucinations (saves {speed_gain:.1f}s)\n")
-
-    lines.append("---\n")
-
-    # Quick Comparison Table
-    lines.append("## 📊 Quick Comparison\n")
-    lines.append("| Tool | Quality | Errors | Speed | Cost @100K/mo | Verdict |")
-    lines.append("|------|---------|--------|-------|---------------|---------|")
-
-    # Filter out _archive
-    display_summary = [s for s in summary if s['name'] != '_archive']
-
-    for i, s in enumerate(display_summary, 1):
-        quality = f"{s.get('quality_score', 0):.0f}/100"
-        errors = s.get('hallucinations', 0)
-        speed = f"{s.get('total_time', 0):.1f}s"
-        cost = f"${s.get('total_cost', 0) * 100000:.0f}"
-
-        # Add emoji indicators
-        quality_indicator = " ⭐" if i == 1 else ""
-        error_indicator = " ✅" if errors == 0 else (" ⚠️" if errors <= 4 else " ❌")
-        speed_indicator = " ⚡" if s.get('total_time', 10) < 7 else ""
-        cost_indicator = " 💰" if s.get('total_cost', 1) < 0.006 else ""
-
-        # Verdict
-        if i == 1:
-            verdict = "✅ **RECOMMENDED**"
-        elif 'claude' in s['name'] and i <= 3:
-            verdict = "Alternative"
-        elif 'gpt4' in s['name']:
-            verdict = "Not recommended"
-        else:
-            verdict = "-"
-
-        name = f"**{s['name']}**" if i == 1 else s['name']
-        lines.append(f"| {name} | {quality}{quality_indicator} | {errors}{error_indicator} | {speed}{speed_indicator} | {cost}{cost_indicator} | {verdict} |")
-
-    lines.append("\n---\n")
-
-    # Rankings by Each KPI Dimension
-    lines.append("## 🏆 Rankings by Each KPI\n")
-    lines.append("*Our evaluation framework measures 5 equally important dimensions (20% each)*\n")
-
-    # Quality
-    lines.append("### 1. Best Quality (Accuracy & Comprehensiveness)\n")
-    for i, s in enumerate(rankings['quality'][:3], 1):
-        if s['name'] == '_archive':
-            continue
-        lines.append(f"{i}. **{s['name']}** - {s.get('quality_score', 0):.1f}/100 ({s.get('hallucinations', 0)} errors)")
-
-    # Speed
-    lines.append("\n### 2. Fastest (Lowest Latency)\n")
-    for i, s in enumerate(rankings['speed'][:3], 1):
-        if s['name'] == '_archive':
-            continue
-        lines.append(f"{i}. **{s['name']}** - {s.get('total_time', 0):.2f}s average response")
-
-    # Cost
-    lines.append("\n### 3. Cheapest (Operational Cost)\n")
-    for i, s in enumerate(rankings['cost'][:3], 1):
-        if s['name'] == '_archive':
-            continue
-        lines.append(f"{i}. **{s['name']}** - ${s.get('total_cost', 0):.4f}/query (${s.get('total_cost', 0) * 100000:.0f} per 100K)")
-
-    # Adoption
-    lines.append("\n### 4. Easiest to Adopt\n")
-    for i, s in enumerate(rankings['adoption'][:3], 1):
-        if s['name'] == '_archive':
-            continue
-        setup_time = "5 min" if 'jina' in s['name'] else "10 min"
-        free_tier = "Free tier available" if 'jina' in s['name'] else "Paid only"
-        lines.append(f"{i}. **{s['name']}** - {setup_time} setup, {free_tier}")
-
-    # Maturity
-    lines.append("\n### 5. Most Mature\n")
-    production_ready = [s for s in rankings['maturity'] if s.get('maturity_score', 0) >= 95 and s['name'] != '_archive']
-    if production_ready:
-        lines.append(f"**Tied:** {', '.join([s['name'] for s in production_ready])} - All production-ready\n")
-
-    lines.append("---\n")
-
-    # Decision Helper
-    lines.append("## 🧭 Decision Helper\n")
-    lines.append("### Which Should You Use?\n")
-
-    zero_error = [s for s in summary if s.get('hallucinations', 0) == 0 and s['name'] != '_archive']
-    if zero_error:
-        lines.append(f"**Need zero hallucinations?** → {zero_error[0]['name']} (only option with 0 errors)\n")
-
-    if best_cost and best_cost['name'] != '_archive':
-        lines.append(f"**Processing >100K queries/month?** → {best_cost['name']} (${best_cost.get('total_cost', 0) * 100000:.0f}/100K queries, still excellent quality)\n")
-
-    fast_options = [s for s in rankings['speed'][:2] if s.get('total_time', 10) < 7 and s['name'] != '_archive']
-    if fast_options:
-        lines.append(f"**Need <7s response time?** → {' or '.join([s['name'] for s in fast_options])} (fastest options, but more errors)\n")
-    else:
-        lines.append(f"**Need <7s response time?** → Reconsider requirements (all quality options are 8-9s)\n")
-
-    if best_quality and best_quality['name'] != '_archive':
-        lines.append(f"**Not sure?** → Start with {best_quality['name']}, switch if cost becomes an issue\n")
-
-    lines.append("---\n")
-
-    # Key Insights
-    lines.append("## 💡 Key Insights\n")
-
-    # Claude vs GPT-4 comparison
-    claude_combos = [s for s in summary if 'claude' in s['name'] and s['name'] != '_archive']
-    gpt4_combos = [s for s in summary if 'gpt4' in s['name'] and s['name'] != '_archive']
-
-    claude_avg_quality = sum(s.get('quality_score', 0) for s in claude_combos) / len(claude_combos) if claude_combos else 0
-    gpt4_avg_quality = sum(s.get('quality_score', 0) for s in gpt4_combos) / len(gpt4_combos) if gpt4_combos else 0
-    quality_diff = claude_avg_quality - gpt4_avg_quality
-
-    claude_errors = sum(s.get('hallucinations', 0) for s in claude_combos)
-    gpt4_errors = sum(s.get('hallucinations', 0) for s in gpt4_combos)
-
-    lines.append(f"**Claude vs GPT-4:** Claude beats GPT-4 across all tools (+{quality_diff:.1f} quality points average, {gpt4_errors - claude_errors} fewer errors)")
-    lines.append(f"→ **Never use GPT-4 combinations**\n")
-
-    lines.append("---\n")
-
-    # Evaluation Rubric
-    lines.append("## 📋 Evaluation Rubric\n")
-    lines.append("Our framework evaluates each combination across five equally important dimensions (20% each):\n")
-    lines.append("| Dimension | Key Metrics | Description |")
-    lines.append("|-----------|-------------|-------------|")
-    lines.append("| **Accuracy & Quality** | Quality Score, Hallucination Rate | Factual correctness and answer completeness |")
-    lines.append("| **Latency** | Total Response Time, Search Time, Generation Time | End-to-end speed and performance |")
-    lines.append("| **Operational Cost** | Cost per Query, Cost at Scale | Direct API costs (search + LLM) |")
-    lines.append("| **Ease of Adoption** | Setup Time, Documentation, API Access | Implementation complexity |")
-    lines.append("| **Maturity** | Stability, Feature Coverage, Support | Production readiness |\n")
-    lines.append("*All dimensions weighted equally at 20% - they are all necessary and important for production use.*\n")
-    lines.append("---\n")
-
-    # AI-Generated Insights
-    lines.append("## AI-Powered Analysis\n")
-    lines.append("*The following insights were generated by Claude Opus 3 analyzing the benchmark data:*\n")
-    lines.append(f"{llm_insights}\n")
-    lines.append("---\n")
-
-    # Detailed Breakdowns for Each Combination
-    lines.append("## Detailed Performance Breakdown\n")
-
-    for rank, s in enumerate(summary, 1):
-        combo_name = s['name']
-        lines.append(f"### {rank}. {combo_name.upper()}\n")
-
-        # Quality Score Calculation
-        lines.append("#### Quality Score Calculation\n")
-        acc = s.get('accuracy', 0)
-        comp = s.get('completeness', 0)
-        clar = s.get('clarity', 0)
-        help_score = s.get('helpfulness', 0)
-        overall = s.get('quality_score', 0)
-
-        lines.append("**Formula:** `Overall = (Accuracy × 0.25) + (Completeness × 0.25) + (Clarity × 0.25) + (Helpfulness × 0.25)`\n")
-        lines.append(f"**Calculation:** `{overall:.1f} = ({acc:.1f} × 0.25) + ({comp:.1f} × 0.25) + ({clar:.1f} × 0.25) + ({help_score:.1f} × 0.25)`\n")
-
-        # Component Scores Table
-        lines.append("| Component | Score | Weight | Contribution |")
-        lines.append("|-----------|-------|--------|--------------|")
-        lines.append(f"| Accuracy | {acc:.1f} | 25% | {acc * 0.25:.1f} |")
-        lines.append(f"| Completeness | {comp:.1f} | 25% | {comp * 0.25:.1f} |")
-        lines.append(f"| Clarity | {clar:.1f} | 25% | {clar * 0.25:.1f} |")
-        lines.append(f"| Helpfulness | {help_score:.1f} | 25% | {help_score * 0.25:.1f} |")
-        lines.append(f"| **Overall Quality** | **{overall:.1f}** | 100% | - |\n")
-
-        # How Scores Are Calculated
-        lines.append("**How These Scores Are Calculated:**\n")
-        lines.append("1. AI Judge (Claude Opus 3) evaluates each of the 25 test questions")
-        lines.append("2. For each question, scores Accuracy, Completeness, Clarity, and Helpfulness (0-100)")
-        lines.append("3. Each component score above is the **average across all 25 questions**")
-        lines.append("4. Overall Quality is the weighted average using the formula above\n")
-
-        # Performance Metrics
-        lines.append("#### Performance & Cost Metrics\n")
-        lines.append("| Metric | Value |")
-        lines.append("|--------|-------|")
-        lines.append(f"| Total Response Time | {s.get('total_time', 0):.2f}s |")
-        lines.append(f"| Search Time | {s.get('search_time', 0):.2f}s |")
-        lines.append(f"| Generation Time | {s.get('gen_time', 0):.2f}s |")
-        lines.append(f"| Cost per Query | ${s.get('total_cost', 0):.4f} |")
-        lines.append(f"| Cost per 100K Queries | ${s.get('total_cost', 0) * 100000:.0f} |")
-        lines.append(f"| Hallucinations | {s.get('hallucinations', 0)}/{s.get('total_evaluated', 25)} |")
-        lines.append(f"| Hallucination Rate | {(s.get('hallucinations', 0) / s.get('total_evaluated', 25) * 100):.1f}% |\n")
-
-        # Individual Question Performance (if available)
-        if combo_name in eval_data and eval_data[combo_name]:
-            lines.append("#### Individual Question Performance\n")
-            lines.append("*Top 5 Best Performing Questions:*\n")
-
-            # Sort by overall_quality
-            questions = sorted(eval_data[combo_name],
-                             key=lambda x: x.get('overall_quality', 0),
-                             reverse=True)[:5]
-
-            lines.append("| Q ID | Quality | Accuracy | Question |")
-            lines.append("|------|---------|----------|----------|")
-            for q in questions:
-                q_id = q.get('question_id', 'N/A')
-                q_qual = q.get('overall_quality', 0)
-                q_acc = q.get('accuracy', 0)
-                q_text = q.get('question', 'N/A')[:60] + "..." if len(q.get('question', '')) > 60 else q.get('question', 'N/A')
-                lines.append(f"| {q_id} | {q_qual:.1f} | {q_acc:.1f} | {q_text} |")
-
-            lines.append("\n*Top 5 Worst Performing Questions:*\n")
-
-            worst_questions = sorted(eval_data[combo_name],
-                                   key=lambda x: x.get('overall_quality', 0))[:5]
-
-            lines.append("| Q ID | Quality | Accuracy | Question |")
-            lines.append("|------|---------|----------|----------|")
-            for q in worst_questions:
-                q_id = q.get('question_id', 'N/A')
-                q_qual = q.get('overall_quality', 0)
-                q_acc = q.get('accuracy', 0)
-                q_text = q.get('question', 'N/A')[:60] + "..." if len(q.get('question', '')) > 60 else q.get('question', 'N/A')
-                lines.append(f"| {q_id} | {q_qual:.1f} | {q_acc:.1f} | {q_text} |")
-
-        lines.append("\n---\n")
-
-    # Cache Performance (if available)
-    if cache_data:
-        lines.append("## Cache Performance\n")
-        lines.append("| Combination | Hit Rate | Exact Hits | Semantic Hits | Avg Retrieval |")
-        lines.append("|-------------|----------|------------|---------------|---------------|")
-
-        for combo in all_combos:
-            if combo in cache_data:
-                cache_stats = cache_data[combo][0] if cache_data[combo] else {}
-                hit_rate = cache_stats.get('hit_rate', 0)
-                exact_hits = cache_stats.get('exact_hits', 0)
-                semantic_hits = cache_stats.get('semantic_hits', 0)
-                avg_retrieval = cache_stats.get('avg_exact_retrieval_time', 0)
-
-                lines.append(
-                    f"| {combo} | {hit_rate:.1f}% | {exact_hits} | {semantic_hits} | {avg_retrieval*1000:.1f}ms |"
+    # Stream the report into RESULTS.md (main results file) and the timestamped copy in
+    # test_results rather than building it in memory first. Both are written to temp files
+    # beside their targets and only moved into place once rendering finished, so a failure
+    # partway never leaves a truncated RESULTS.md behind
+    results_path = "RESULTS.md"
+    timestamp_file = f"benchmark_report_{time.strftime('%Y%m%d-%H%M%S')}.md"
+    timestamp_path = os.path.join(results_dir, timestamp_file)
+    results_tmp = f"{results_path}.tmp"
+    timestamp_tmp = f"{timestamp_path}.tmp"
+    try:
+        with open(results_tmp, 'w', buffering=1 << 16) as results_f, \
+                open(timestamp_tmp, 'w', buffering=1 << 16) as timestamp_f:
+            def write(text):
+                results_f.write(text)
+                timestamp_f.write(text)
+
+            # Header
+            write(
+                "# Benchmark Results & Analysis\n\n"
+                f"**Last Updated:** {timestamp}\n"
+                f"**Questions Tested:** {summary[0].get('total_evaluated', 25) if summary else 25}\n"
+                f"**Combinations Tested:** {len(non_archive)}\n\n"
+            )
+
+            # Executive Summary - THE ANSWER
+            write(
+                "---\n\n"
+                "## 🎯 Executive Summary: Recommendation\n\n"
+            )
+
+            # Get the winners
+            best_quality = rankings['quality'][0] if rankings['quality'] else None
+            best_speed = rankings['speed'][0] if rankings['speed'] else None
+            best_cost = rankings['cost'][0] if rankings['cost'] else None
+
+            if best_quality and best_quality['name'] != '_archive':
+                write(
+                    f"### ✅ **RECOMMENDED: {best_quality['name'].upper()}**\n\n"
+                    f"**Quality:** {best_quality.get('quality_score', 0):.1f}/100 (highest)\n"
+                    f"**Hallucinations:** {best_quality.get('hallucinations', 0)} (out of 25 questions)\n"
+                    f"**Cost:** ${best_quality.get('total_cost', 0):.4f}/query (${best_quality.get('total_cost', 0) * 100000:.0f} per 100K queries)\n"
+                    f"**Speed:** {best_quality.get('total_time', 0):.2f}s average response time\n\n"
                 )
 
-        lines.append("\n---\n")
+                # When to switch
+                if best_cost and best_cost['name'] != best_quality['name'] and best_cost['name'] != '_archive':
+                    cost_savings = (best_quality.get('total_cost', 0) - best_cost.get('total_cost', 0)) * 100000
+                    quality_diff = best_quality.get('quality_score', 0) - best_cost.get('quality_score', 0)
+                    write(f"**Switch to {best_cost['name']} if:** Processing >100K queries/month (saves ${cost_savings:.0f}/month, quality drops {quality_diff:.1f} points)\n\n")
+
+                if best_speed and best_speed['name'] != best_quality['name'] and best_speed['name'] != '_archive':
+                    speed_gain = best_quality.get('total_time', 0) - best_speed.get('total_time', 0)
+                    speed_halluc = best_speed.get('hallucinations', 0)
+                    write(f"**Switch to {best_speed['name']} if:** Must have <7s response AND can tolerate {speed_halluc} hallucinations (saves {speed_gain:.1f}s)\n\n")
+
+            write("---\n\n")
+
+            # Quick Comparison Table
+            write(
+                "## 📊 Quick Comparison\n\n"
+                "| Tool | Quality | Errors | Speed | Cost @100K/mo | Verdict |\n"
+                "|------|---------|--------|-------|---------------|---------|\n"
+            )
+
+            for i, s in enumerate(non_archive, 1):
+                quality = f"{s.get('quality_score', 0):.0f}/100"
+                errors = s.get('hallucinations', 0)
+                speed = f"{s.get('total_time', 0):.1f}s"
+                cost = f"${s.get('total_cost', 0) * 100000:.0f}"
+
+                # Add emoji indicators
+                quality_indicator = RANK_INDICATORS.get(i, "")
+                error_indicator = ERROR_INDICATORS[min(errors, len(ERROR_INDICATORS) - 1)]
+                speed_indicator = " ⚡" if s.get('total_time', 10) < 7 else ""
+                cost_indicator = " 💰" if s.get('total_cost', 1) < 0.006 else ""
+
+                # Verdict
+                if i == 1:
+                    verdict = "✅ **RECOMMENDED**"
+                elif s['llm'] == 'claude' and i <= 3:
+                    verdict = "Alternative"
+                elif s['llm'] == 'gpt4':
+                    verdict = "Not recommended"
+                else:
+                    verdict = "-"
+
+                name = f"**{s['name']}**" if i == 1 else s['name']
+                write(f"| {name} | {quality}{quality_indicator} | {errors}{error_indicator} | {speed}{speed_indicator} | {cost}{cost_indicator} | {verdict} |\n")
+
+            write("\n---\n\n")
+
+            # Rankings by Each KPI Dimension
+            write(
+                "## 🏆 Rankings by Each KPI\n\n"
+                "*Our evaluation framework measures 5 equally important dimensions (20% each)*\n\n"
+            )
+
+            # Quality
+            write("### 1. Best Quality (Accuracy & Comprehensiveness)\n\n")
+            for i, s in enumerate(rankings['quality'][:3], 1):
+                if s['name'] == '_archive':
+                    continue
+                write(f"{i}. **{s['name']}** - {s.get('quality_score', 0):.1f}/100 ({s.get('hallucinations', 0)} errors)\n")
+
+            # Speed
+            write("\n### 2. Fastest (Lowest Latency)\n\n")
+            for i, s in enumerate(rankings['speed'][:3], 1):
+                if s['name'] == '_archive':
+                    continue
+                write(f"{i}. **{s['name']}** - {s.get('total_time', 0):.2f}s average response\n")
+
+            # Cost
+            write("\n### 3. Cheapest (Operational Cost)\n\n")
+            for i, s in enumerate(rankings['cost'][:3], 1):
+                if s['name'] == '_archive':
+                    continue
+                write(f"{i}. **{s['name']}** - ${s.get('total_cost', 0):.4f}/query (${s.get('total_cost', 0) * 100000:.0f} per 100K)\n")
+
+            # Adoption
+            write("\n### 4. Easiest to Adopt\n\n")
+            for i, s in enumerate(rankings['adoption'][:3], 1):
+                if s['name'] == '_archive':
+                    continue
+                is_jina = s['tool'] == 'jina'
+                setup_time = "5 min" if is_jina else "10 min"
+                free_tier = "Free tier available" if is_jina else "Paid only"
+                write(f"{i}. **{s['name']}** - {setup_time} setup, {free_tier}\n")
+
+            # Maturity
+            write("\n### 5. Most Mature\n\n")
+            production_ready = [s for s in rankings['maturity'] if s.get('maturity_score', 0) >= 95 and s['name'] != '_archive']
+            if production_ready:
+                write(f"**Tied:** {', '.join([s['name'] for s in production_ready])} - All production-ready\n\n")
+
+            write("---\n\n")
+
+            # Decision Helper
+            write(
+                "## 🧭 Decision Helper\n\n"
+                "### Which Should You Use?\n\n"
+            )
+
+            zero_error = [s for s in non_archive if s.get('hallucinations', 0) == 0]
+            if zero_error:
+                write(f"**Need zero hallucinations?** → {zero_error[0]['name']} (only option with 0 errors)\n\n")
+
+            if best_cost and best_cost['name'] != '_archive':
+                write(f"**Processing >100K queries/month?** → {best_cost['name']} (${best_cost.get('total_cost', 0) * 100000:.0f}/100K queries, still excellent quality)\n\n")
+
+            fast_options = [s for s in rankings['speed'][:2] if s.get('total_time', 10) < 7 and s['name'] != '_archive']
+            if fast_options:
+                write(f"**Need <7s response time?** → {' or '.join([s['name'] for s in fast_options])} (fastest options, but more errors)\n\n")
+            else:
+                write(f"**Need <7s response time?** → Reconsider requirements (all quality options are 8-9s)\n\n")
+
+            if best_quality and best_quality['name'] != '_archive':
+                write(f"**Not sure?** → Start with {best_quality['name']}, switch if cost becomes an issue\n\n")
+
+            write("---\n\n")
+
+            # Key Insights
+            write("## 💡 Key Insights\n\n")
+
+            # Claude vs GPT-4 comparison
+            claude_count, claude_quality, claude_errors = vendor_totals['claude']
+            gpt4_count, gpt4_quality, gpt4_errors = vendor_totals['gpt4']
+
+            claude_avg_quality = claude_quality / claude_count if claude_count else 0
+            gpt4_avg_quality = gpt4_quality / gpt4_count if gpt4_count else 0
+            quality_diff = claude_avg_quality - gpt4_avg_quality
+
+            write(
+                f"**Claude vs GPT-4:** Claude beats GPT-4 across all tools (+{quality_diff:.1f} quality points average, {gpt4_errors - claude_errors} fewer errors)\n"
+                f"→ **Never use GPT-4 combinations**\n\n"
+            )
+
+            write("---\n\n")
+
+            # Evaluation Rubric
+            write(RUBRIC_SECTION)
+
+            # AI-Generated Insights
+            write(
+                "## AI-Powered Analysis\n\n"
+                "*The following insights were generated by Claude Opus 3 analyzing the benchmark data:*\n\n"
+                f"{llm_insights}\n\n"
+                "---\n\n"
+            )
+
+            # Detailed Breakdowns for Each Combination
+            write("## Detailed Performance Breakdown\n\n")
+
+            for rank, s in enumerate(summary, 1):
+                combo_name = s['name']
+                acc = s.get('accuracy', 0)
+                comp = s.get('completeness', 0)
+                clar = s.get('clarity', 0)
+                help_score = s.get('helpfulness', 0)
+                write(QUALITY_DETAIL_TMPL.format_map({
+                    "rank": rank,
+                    "name_upper": combo_name.upper(),
+                    "overall": s.get('quality_score', 0),
+                    "acc": acc, "comp": comp, "clar": clar, "help_score": help_score,
+                    "acc_w": acc * 0.25, "comp_w": comp * 0.25,
+                    "clar_w": clar * 0.25, "help_w": help_score * 0.25,
+                }))
+
+                # Performance Metrics
+                total_cost = s.get('total_cost', 0)
+                hallucinations = s.get('hallucinations', 0)
+                total_evaluated = s.get('total_evaluated', 25)
+                write(
+                    "#### Performance & Cost Metrics\n\n"
+                    "| Metric | Value |\n"
+                    "|--------|-------|\n"
+                )
+                write("".join(PERF_ROW_TMPL.format_map({"k": k, "v": v}) for k, v in (
+                    ("Total Response Time", f"{s.get('total_time', 0):.2f}s"),
+                    ("Search Time", f"{s.get('search_time', 0):.2f}s"),
+                    ("Generation Time", f"{s.get('gen_time', 0):.2f}s"),
+                    ("Cost per Query", f"${total_cost:.4f}"),
+                    ("Cost per 100K Queries", f"${total_cost * 100000:.0f}"),
+                    ("Hallucinations", f"{hallucinations}/{total_evaluated}"),
+                )))
+                write(PERF_ROW_TMPL.format_map({
+                    "k": "Hallucination Rate",
+                    "v": f"{(hallucinations / total_evaluated * 100):.1f}%"
+                }) + "\n")
+
+                # Individual Question Performance (if available)
+                if combo_name in eval_data and eval_data[combo_name]:
+                    questions, worst_questions = extreme_questions(eval_data[combo_name])
+                    write(
+                        "#### Individual Question Performance\n\n"
+                        "*Top 5 Best Performing Questions:*\n\n"
+                    )
+
+                    write(QUESTION_TABLE_HEADER)
+                    write("".join(QUESTION_ROW_TMPL.format_map(_question_row(q)) for q in questions))
+
+                    write("\n*Top 5 Worst Performing Questions:*\n\n")
+
+                    write(QUESTION_TABLE_HEADER)
+                    write("".join(QUESTION_ROW_TMPL.format_map(_question_row(q)) for q in worst_questions))
+
+                write("\n---\n\n")
+
+            # Cache Performance (if available)
+            if cache_data:
+                write(
+                    "## Cache Performance\n\n"
+                    "| Combination | Hit Rate | Exact Hits | Semantic Hits | Avg Retrieval |\n"
+                    "|-------------|----------|------------|---------------|---------------|\n"
+                )
 
-    # Print and Save to RESULTS.md
-    report_content = "\n".join(lines)
+                for combo in all_combos:
+                    if combo in cache_data:
+                        cache_stats = cache_data[combo][0] if cache_data[combo] else {}
+                        hit_rate = cache_stats.get('hit_rate', 0)
+                        exact_hits = cache_stats.get('exact_hits', 0)
+                        semantic_hits = cache_stats.get('semantic_hits', 0)
+                        avg_retrieval = cache_stats.get('avg_exact_retrieval_time', 0)
+
+                        write(
+                            f"| {combo} | {hit_rate:.1f}% | {exact_hits} | {semantic_hits} | {avg_retrieval*1000:.1f}ms |\n"
+                        )
+
+                write("\n---\n\n")
+    except BaseException:
+        for tmp in (results_tmp, timestamp_tmp):
+            Path(tmp).unlink(missing_ok=True)
+        raise
+    os.replace(results_tmp, results_path)
+    os.replace(timestamp_tmp, timestamp_path)
 
-    # Save to RESULTS.md (main results file)
-    results_path = "RESULTS.md"
-    with open(results_path, 'w') as f:
-        f.write(report_content)
     print(f"✅ Comprehensive results saved to: {results_path}")
-
-    # Also save timestamped version in test_results
-    timestamp_file = f"benchmark_report_{time.strftime('%Y%m%d-%H%M%S')}.md"
-    timestamp_path = os.path.join(results_dir, timestamp_file)
-    with open(timestamp_path, 'w') as f:
-        f.write(report_content)
     print(f"✅ Timestamped copy saved to: {timestamp_path}")
 
+    if args.emit_json:
+        emit_json(Path(timestamp_path).with_suffix(".json"))
+
+    # Insights generated during this run are now cached, so record the state they leave behind
+    fingerprint = report_fingerprint(summary, cache_data, os.path.exists(insights_path))
+    try:
+        with open(hash_path, 'w') as f:
+            f.write(fingerprint)
+    except OSError as e:
+        print(f"Warning: Could not record report fingerprint: {e}")
+
+    save_manifest(results_dir, manifest)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,56 +1,128 @@
 import argparse
-import json
+import logging
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+
+# Project root (/workspace/ or /home/.../website-rag/), resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_QUESTIONS = "config/test_suites/standard_questions.json"
+
 # Add api to path to import tools
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+sys.path.append(str(PROJECT_ROOT))
+
+from api.app.core.logging import get_logger
+
+logger = get_logger("run_evaluation")
+
+# Tool, LLM and judge modules are imported inside main() only for the combination being run,
+# so a run does not pay the import cost of SDKs it never uses
+
+TARGET_URL = "https://bizgenieai.com/"
 
-from api.app.tools.jina_tool import JinaTool
-from api.app.tools.tavily_tool import TavilyTool
-from api.app.tools.exa_tool import ExaTool
-from api.app.tools.firecrawl_tool import FirecrawlTool
-from api.app.llm.claude_llm import ClaudeLLM
-from api.app.llm.gpt4_llm import GPT4LLM
-from scripts.ai_judge import AIJudge
+SYSTEM_PROMPT = (
+    f"You are an expert customer support representative for {TARGET_URL}. "
+    "Your goal is to provide accurate, helpful answers primarily based on the information "
+    "retrieved from this website."
+)
 
 def load_json(filepath):
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
+
+def process_question(q, mcp_tool, llm, workers=1):
+    """
+    Run search + generation for one question.
+    Returns (result_entry or None on failure, log records), so callers running
+    questions concurrently can emit each question's log as one block.
+    Log records are (level, msg, args) tuples, formatted lazily by the logger.
+    workers is recorded in the metrics, since concurrency affects the measured timings.
+    """
+    qid = q["id"]
+    question_text = q["question"]
+    log = [(logging.INFO, "Processing %s: %s", (qid, question_text))]
+
+    # 1. Search
+    start_search = time.perf_counter()
+    try:
+        search_res = mcp_tool.search(question_text, context=TARGET_URL)
+        search_time = time.perf_counter() - start_search
+        log.append((logging.INFO, "   ✓ Search found %d sources (%.2fs)", (len(search_res.sources), search_time)))
+    except Exception as e:
+        log.append((logging.ERROR, "   ❌ Search failed: %s", (e,)))
+        return None, log
+
+    # 2. Generate
+    start_gen = time.perf_counter()
+    history = [{"role": "user", "content": question_text}]
+
+    try:
+        llm_res = llm.generate(history, search_res.content, system_prompt=SYSTEM_PROMPT)
+        gen_time = time.perf_counter() - start_gen
+        log.append((logging.INFO, "   ✓ Answer generated (%.2fs)", (gen_time,)))
+    except Exception as e:
+        log.append((logging.ERROR, "   ❌ Generation failed: %s", (e,)))
+        return None, log
+
+    # Store result
+    result_entry = {
+        "question_id": qid,
+        "question": question_text,
+        "answer": llm_res.answer,
+        "sources": search_res.sources,
+        "metrics": {
+            "search_time": search_time,
+            "gen_time": gen_time,
+            "total_time": search_time + gen_time,
+            "workers": workers,
+            "tokens": llm_res.tokens_used,
+            # Add costs here for reporting
+            "search_cost": getattr(search_res, 'search_cost', 0.0),
+            "gen_cost": getattr(llm_res, 'generation_cost', 0.0)
+        }
+    }
+    return result_entry, log
 
 def main():
     parser = argparse.ArgumentParser(description="Run RAG Evaluation")
     parser.add_argument("--mcp", required=True, choices=["jina", "tavily", "firecrawl"], help="MCP Tool to test")
     parser.add_argument("--llm", required=True, choices=["claude", "gpt4"], help="LLM to test")
-    parser.add_argument("--questions", default="config/test_suites/standard_questions.json")
+    parser.add_argument("--questions", default=DEFAULT_QUESTIONS)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Questions to run concurrently (default: 1). Concurrent runs finish sooner, but "
+                             "per-question timings then include contention and aren't comparable to sequential runs")
     args = parser.parse_args()
 
-    # Path adjustments - Absolute paths relative to script location
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir) # /workspace/ or /home/.../website-rag/ 
-    
-    questions_path = os.path.join(project_root, args.questions)
+    # Paths are relative to the project root, not the working directory
+    questions_path = PROJECT_ROOT / args.questions
     
     # Initialize Tool
-    print(f"Initializing {args.mcp}...")
+    logger.info("Initializing %s...", args.mcp)
     if args.mcp == "jina":
+        from api.app.tools.jina_tool import JinaTool
         mcp_tool = JinaTool({"api_key_env": "JINA_API_KEY"})
     elif args.mcp == "tavily":
+        from api.app.tools.tavily_tool import TavilyTool
         mcp_tool = TavilyTool({"api_key_env": "TAVILY_API_KEY", "config": {"search_depth": "advanced"}})
     elif args.mcp == "firecrawl":
+        from api.app.tools.firecrawl_tool import FirecrawlTool
         mcp_tool = FirecrawlTool({"api_key_env": "FIRECRAWL_API_KEY"})
 
     # Initialize LLM
-    print(f"Initializing {args.llm}...")
+    logger.info("Initializing %s...", args.llm)
     if args.llm == "claude":
+        from api.app.llm.claude_llm import ClaudeLLM
         llm_config = {
             "api_key_env": "ANTHROPIC_API_KEY",
             "config": {"model": "claude-3-opus-20240229"}
         }
         llm = ClaudeLLM(llm_config)
     else:
+        from api.app.llm.gpt4_llm import GPT4LLM
         llm_config = {
             "api_key_env": "OPENAI_API_KEY",
             "config": {"model": "gpt-4-turbo-preview"}
@@ -58,94 +130,50 @@ def main():
         llm = GPT4LLM(llm_config)
 
     # Initialize Judge
+    from scripts.ai_judge import AIJudge
     judge = AIJudge()
 
     # Load Questions
     try:
-        with open(questions_path, 'r') as f:
-            questions = json.load(f)
+        questions = load_json(questions_path)
     except Exception as e:
-        print(f"Error loading questions: {e}")
-        print(f"Questions Path: {questions_path}")
+        logger.error("Error loading questions: %s (path: %s)", e, questions_path)
         return
 
     system_results = []
     timestamp = time.strftime("%Y%m%d-%H%M%S")
     
-    print(f"\n🚀 Starting evaluation run: {args.mcp} + {args.llm}")
-    print("="*50)
+    logger.info("🚀 Starting evaluation run: %s + %s", args.mcp, args.llm)
 
-    target_url = "https://bizgenieai.com/"
+    output_dir = PROJECT_ROOT / "test_results" / f"{args.mcp}_{args.llm}"
+    os.makedirs(output_dir, exist_ok=True)
+    results_file = os.path.join(output_dir, f"results_{timestamp}.json")
+    eval_file = os.path.join(output_dir, f"eval_{timestamp}.json")
+    # Each result is also appended here as it completes, so a crashed run keeps its work
+    partial_file = Path(results_file).with_suffix(".jsonl")
 
     # --- PHASE 1: EXECUTION ---
-    for i, q in enumerate(questions, 1):
-        qid = q["id"]
-        question_text = q["question"]
-        
-        print(f"\n[{i}/{len(questions)}] Processing {qid}: {question_text}")
-
-        # 1. Search
-        start_search = time.time()
-        try:
-            search_res = mcp_tool.search(question_text, context=target_url)
-            search_time = time.time() - start_search
-            print(f"   ✓ Search found {len(search_res.sources)} sources ({search_time:.2f}s)")
-        except Exception as e:
-            print(f"   ❌ Search failed: {e}")
-            continue
-
-        # 2. Generate
-        start_gen = time.time()
-        
-        system_prompt = (
-            f"You are an expert customer support representative for {target_url}. "
-            "Your goal is to provide accurate, helpful answers primarily based on the information "
-            "retrieved from this website."
-        )
-        
-        history = [{"role": "user", "content": question_text}]
-
-        try:
-            llm_res = llm.generate(history, search_res.content, system_prompt=system_prompt)
-            gen_time = time.time() - start_gen
-            print(f"   ✓ Answer generated ({gen_time:.2f}s)")
-        except Exception as e:
-            print(f"   ❌ Generation failed: {e}")
-            continue
-
-        # Store result
-        result_entry = {
-            "question_id": qid,
-            "question": question_text,
-            "answer": llm_res.answer,
-            "sources": search_res.sources,
-            "metrics": {
-                "search_time": search_time,
-                "gen_time": gen_time,
-                "total_time": search_time + gen_time,
-                "tokens": llm_res.tokens_used,
-                # Add costs here for reporting
-                "search_cost": getattr(search_res, 'search_cost', 0.0),
-                "gen_cost": getattr(llm_res, 'generation_cost', 0.0)
-            }
-        }
-        system_results.append(result_entry)
+    # Questions are independent, so --workers > 1 runs them on a thread pool; map() keeps
+    # question order for both the printed logs and the saved results
+    workers = max(1, min(args.workers, len(questions)))
+    with ThreadPoolExecutor(max_workers=workers) as executor, open(partial_file, 'ab') as partial:
+        outcomes = executor.map(lambda q: process_question(q, mcp_tool, llm, workers), questions)
+        for i, (result_entry, log) in enumerate(outcomes, 1):
+            for level, msg, msg_args in log:
+                logger.log(level, "[%d/%d] " + msg, i, len(questions), *msg_args)
+            if result_entry is not None:
+                system_results.append(result_entry)
+                partial.write(orjson.dumps(result_entry) + b"\n")
+                partial.flush()
 
     # Save System Results
-    output_dir = os.path.join(project_root, "test_results", f"{args.mcp}_{args.llm}")
-    os.makedirs(output_dir, exist_ok=True)
-    results_file = os.path.join(output_dir, f"results_{timestamp}.json")
-    eval_file = os.path.join(output_dir, f"eval_{timestamp}.json")
-    
-    with open(results_file, 'w') as f:
-        json.dump(system_results, f, indent=2)
+    Path(results_file).write_bytes(orjson.dumps(system_results, option=orjson.OPT_INDENT_2))
+    partial_file.unlink(missing_ok=True)
 
-    print("\n" + "="*60)
-    print(f"✅ Execution complete. Results saved to {results_file}")
-    print("="*60)
+    logger.info("✅ Execution complete. Results saved to %s", results_file)
 
     # --- PHASE 2: EVALUATION ---
-    print(f"\n⚖️  Starting AI Judge Evaluation...")
+    logger.info("⚖️  Starting AI Judge Evaluation...")
     
     try:
         judge.evaluate_batch(
@@ -153,9 +181,7 @@ def main():
             output_file=eval_file
         )
     except Exception as e:
-        print(f"\n❌ Evaluation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Evaluation failed: %s", e)
 
 if __name__ == "__main__":
     main()
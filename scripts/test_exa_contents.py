@@ -50,15 +50,19 @@ def test_exa_crawling():
         print(f"   ❌ Error: {e}")
 
     # Test 2: Explicit List Retrieval
+    # Test 3's subpage is one of these URLs, so a single request serves both tests
     print("\n2. Testing Explicit List Retrieval (3 URLs)...")
     all_urls = [target_url] + subpages
+    by_url = None
     try:
         response = client.get_contents(
             all_urls,
             text=True,
             livecrawl="always"
         )
-        
+        # Index by URL (ignoring a trailing slash) so Test 3 can pick its page out
+        by_url = {res.url.rstrip("/"): res for res in response.results}
+
         if response.results:
             print(f"   ✅ Success! Retrieved {len(response.results)}/{len(all_urls)} requested pages.")
             for res in response.results:
@@ -69,24 +73,19 @@ def test_exa_crawling():
     except Exception as e:
         print(f"   ❌ Error: {e}")
 
-    # Test 3: Single Subpage Retrieval
+    # Test 3: Single Subpage Retrieval (answered from the Test 2 response)
     print("\n3. Testing Single Subpage Retrieval...")
     subpage_url = "https://sammamishchamber.org/explore/"
-    try:
-        response = client.get_contents(
-            [subpage_url],
-            text=True,
-            livecrawl="always"
-        )
-        if response.results:
+    if by_url is None:
+        print("   ❌ Skipped: explicit list request failed.")
+    else:
+        result = by_url.get(subpage_url.rstrip("/"))
+        if result:
             print(f"   ✅ Success! Retrieved subpage.")
-            print(f"   Title: {response.results[0].title}")
-            print(f"   URL: {response.results[0].url}")
+            print(f"   Title: {result.title}")
+            print(f"   URL: {result.url}")
         else:
             print("   ❌ Failed to retrieve subpage.")
-            
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
 
 if __name__ == "__main__":
     test_exa_crawling()
\ No newline at end of file
@@ -10,16 +10,31 @@ Usage:
 
     # Or test specific configuration
     python3 scripts/test_exa_tuning.py --config neural --results 10
+
+    # Run 10 searches at a time for a quicker pass (concurrent runs inflate per-search timings)
+    python3 scripts/test_exa_tuning.py --workers 10
+
+    # Reuse Exa results cached on disk by earlier --cache runs (timings then exclude cached searches)
+    python3 scripts/test_exa_tuning.py --cache
 """
 import os
 import sys
-import json
+import hashlib
+import re
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
+
+import orjson
+
+# Project root (/workspace/ or /home/.../website-rag/), resolved once at import
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 # Add parent directory to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+sys.path.append(str(PROJECT_ROOT))
 
 from exa_py import Exa
 from api.app.llm.claude_llm import ClaudeLLM
@@ -72,32 +87,151 @@ EXA_CONFIGS = {
     },
 }
 
+# Opt-in (--cache) on-disk cache of Exa search results, keyed by a hash of the full search
+# parameters. Entries never expire, so they reflect Exa's index as of when they were fetched.
+# Anchored to the project root so every working directory shares one cache
+EXA_CACHE_DIR = str(PROJECT_ROOT / ".cache" / "exa")
+
+# Attempts per Exa search; transient failures back off 1s, 2s, 4s... (capped at SEARCH_BACKOFF_MAX)
+SEARCH_ATTEMPTS = 3
+SEARCH_BACKOFF_MAX = 10
+
+# Seconds to wait for one generated answer before recording a fallback and moving on
+ANSWER_TIMEOUT = 30
+
+
+def _cache_path(cache_dir, search_params):
+    """Content-addressed cache file for one set of Exa search parameters"""
+    key = hashlib.blake2b(orjson.dumps(search_params, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"{key}.json")
+
+
+@dataclass
+class ConfigStats:
+    """Search totals for one configuration's questions (total_time covers live searches only)"""
+    total_q: int
+    successful: int
+    total_results: int
+    total_time: float
+    cached_q: int
+
+    @property
+    def avg_results(self):
+        return self.total_results / max(self.successful, 1)
+
+    @property
+    def avg_time(self):
+        """Average live Exa search time, or None when every search was served from the cache"""
+        live_q = self.total_q - self.cached_q
+        return self.total_time / live_q if live_q else None
+
+    @property
+    def avg_time_text(self):
+        avg_time = self.avg_time
+        text = "n/a" if avg_time is None else f"{avg_time:.2f}s"
+        if self.cached_q:
+            text += f" ({self.cached_q} cached, excluded)"
+        return text
+
+    @property
+    def score(self):
+        return self.successful * 100 + self.total_results
+
+
+def config_stats(questions):
+    """Tally a configuration's question results in a single pass"""
+    successful = total_results = cached_q = 0
+    total_time = 0
+    for q in questions:
+        # A cache hit's time is a disk read, not an Exa search
+        if q.get("cached"):
+            cached_q += 1
+        else:
+            total_time += q.get("search_time", 0)
+        if q.get("success"):
+            successful += 1
+            total_results += q.get("num_results", 0)
+    return ConfigStats(len(questions), successful, total_results, total_time, cached_q)
+
+
+def base_search_params(config):
+    """Exa search parameters shared by every question of a configuration"""
+    base_params = {
+        "num_results": config.get("num_results", 5),
+        "type": config.get("type", "neural"),
+        "text": config.get("text", True)
+    }
 
-def test_exa_search(exa_client, question, config):
-    """Test a single search with given configuration"""
-    print(f"\n  Testing: {question[:60]}...")
-
-    start_time = time.time()
+    # Add optional parameters
+    if config.get("include_domains"):
+        base_params["include_domains"] = config["include_domains"]
+    if config.get("start_published_date"):
+        base_params["start_published_date"] = config["start_published_date"]
+
+    return base_params
+
+
+def _is_transient(error):
+    """Whether a failed Exa call is worth retrying: rate limits, server errors, timeouts, dropped connections"""
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    if status is None:
+        # exa_py reports HTTP failures as "Request failed with status code N: ..."
+        match = re.search(r"status code (\d{3})", str(error))
+        status = int(match.group(1)) if match else None
+    if status is not None:
+        return status == 429 or status >= 500
+    # Timeouts and connection errors (builtin and requests') are all OSErrors
+    return isinstance(error, OSError)
+
+
+def test_exa_search(exa_client, question, base_params, cache_dir=None):
+    """Test a single search with a configuration's base_search_params().
+
+    Does not print, so searches can run concurrently; main() reports each result in order
+    (including any "cache_error"). Results are cached in cache_dir across runs when given. Transient failures are
+    retried up to SEARCH_ATTEMPTS times; the result records how many Exa calls were made, and
+    search_time covers only the last call (not earlier attempts or backoff waits).
+    """
+    start_time = time.perf_counter()
+    attempts = 0
+    cache_error = None
     try:
         # Prepare search parameters
-        search_params = {
-            "query": question,
-            "num_results": config.get("num_results", 5),
-            "type": config.get("type", "neural"),
-            "text": config.get("text", True)
-        }
-
-        # Add optional parameters
-        if config.get("include_domains"):
-            search_params["include_domains"] = config["include_domains"]
-        if config.get("start_published_date"):
-            search_params["start_published_date"] = config["start_published_date"]
+        search_params = {"query": question, **base_params}
+
+        # Check cache first
+        results = None
+        cache_path = _cache_path(cache_dir, search_params) if cache_dir else None
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    results = orjson.loads(f.read())
+            except (OSError, ValueError):
+                results = None  # Unreadable entry: search again and overwrite it
+        cached = results is not None
 
         # Execute search
-        response = exa_client.search_and_contents(**search_params)
-
-        search_time = time.time() - start_time
-        results = response.results
+        if not cached:
+            while True:
+                attempts += 1
+                start_time = time.perf_counter()
+                try:
+                    response = exa_client.search_and_contents(**search_params)
+                    break
+                except Exception as e:
+                    if attempts >= SEARCH_ATTEMPTS or not _is_transient(e):
+                        raise
+                    time.sleep(min(2 ** (attempts - 1), SEARCH_BACKOFF_MAX))
+            search_time = time.perf_counter() - start_time
+            results = [{"title": res.title, "url": res.url, "text": res.text} for res in response.results]
+            if cache_path:
+                try:
+                    os.makedirs(cache_dir, exist_ok=True)
+                    Path(cache_path).write_bytes(orjson.dumps(results))
+                except OSError as e:
+                    cache_error = str(e)
+        else:
+            search_time = time.perf_counter() - start_time
 
         # Extract info
         result_data = {
@@ -105,27 +239,31 @@ def test_exa_search(exa_client, question, config):
             "num_results": len(results),
             "search_time": search_time,
             "success": True,
+            "cached": cached,
+            "attempts": attempts,
             "results": []
         }
+        if cache_error:
+            result_data["cache_error"] = cache_error
 
         for res in results:
+            text = res["text"]
             result_data["results"].append({
-                "title": res.title or "No title",
-                "url": res.url,
-                "text_length": len(res.text) if res.text else 0,
-                "text_preview": res.text[:200] + "..." if res.text and len(res.text) > 200 else res.text or ""
+                "title": res["title"] or "No title",
+                "url": res["url"],
+                "text_length": len(text) if text else 0,
+                "text_preview": text[:200] + "..." if text and len(text) > 200 else text or ""
             })
 
-        print(f"    ✅ Found {len(results)} results in {search_time:.2f}s")
         return result_data
 
     except Exception as e:
-        print(f"    ❌ Error: {str(e)}")
         return {
             "question": question,
             "success": False,
             "error": str(e),
-            "search_time": time.time() - start_time
+            "attempts": attempts,
+            "search_time": time.perf_counter() - start_time
         }
 
 
@@ -136,9 +274,34 @@ def generate_answer(llm, question, search_content):
         system_prompt = "You are a helpful assistant. Answer the question based on the provided context."
 
         response = llm.generate(messages, search_content, system_prompt)
-        return response.content, response.gen_time
+        return response.answer, response.generation_time
     except Exception as e:
-        return f"Error generating answer: {e}", 0
+        return f"Error generating answer: {e}", None
+
+
+def generate_answers(llm, results, workers):
+    """Generate answers for every successful search concurrently, storing them on each result.
+
+    ClaudeLLM.generate is blocking, so calls run on a thread pool. Each answer gets ANSWER_TIMEOUT
+    (also the LLM client's request timeout); one still pending after that gets a fallback. Failed
+    or timed-out answers store gen_time None so they stay out of generation-time averages.
+    """
+    pending = [r for r in results if r.get("success")]
+    if not pending:
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending)))) as executor:
+        futures = []
+        for result in pending:
+            # Combine all text from results
+            context = "\n\n".join([r["text_preview"] for r in result["results"] if r.get("text_preview")])
+            futures.append(executor.submit(generate_answer, llm, result["question"], context))
+
+        for result, future in zip(pending, futures):
+            try:
+                result["answer"], result["gen_time"] = future.result(timeout=ANSWER_TIMEOUT)
+            except TimeoutError:
+                result["answer"], result["gen_time"] = f"Error generating answer: timed out after {ANSWER_TIMEOUT}s", None
 
 
 def main():
@@ -149,6 +312,12 @@ def main():
                        help="Number of questions to test (default: 5)")
     parser.add_argument("--generate-answers", action="store_true",
                        help="Also generate and show answers using Claude")
+    parser.add_argument("--workers", type=int, default=1,
+                       help="Exa searches / answers to run concurrently (default: 1). Concurrent runs finish "
+                            "sooner, but inflate per-search timings, so configs' Avg Search Time isn't comparable")
+    parser.add_argument("--cache", action="store_true",
+                       help=f"Reuse (and store) Exa results cached in {EXA_CACHE_DIR}; cached searches are "
+                            "excluded from search-time averages")
     args = parser.parse_args()
 
     # Initialize Exa client
@@ -164,7 +333,7 @@ def main():
     if args.generate_answers:
         llm = ClaudeLLM({
             "api_key_env": "ANTHROPIC_API_KEY",
-            "config": {"model": "claude-3-opus-20240229"}
+            "config": {"model": "claude-3-opus-20240229", "timeout": ANSWER_TIMEOUT}
         })
 
     # Select configurations to test
@@ -180,6 +349,7 @@ def main():
     print(f"Questions: {len(questions)}")
     print(f"Configurations: {len(configs_to_test)}")
     print(f"Generate Answers: {'Yes' if args.generate_answers else 'No'}")
+    print(f"Search Cache: {EXA_CACHE_DIR if args.cache else 'Off'}")
     print()
 
     # Results storage
@@ -190,6 +360,38 @@ def main():
         "results": {}
     }
 
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
+    output_dir = "test_results/exa_tuning"
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = f"{output_dir}/exa_test_{timestamp}.json"
+    # Each search is also appended here as it completes, so a crashed run keeps its work
+    # even without --cache
+    partial_file = Path(output_file).with_suffix(".jsonl")
+
+    # Every (config, question) search is independent and network-bound, so run them all on
+    # one thread pool; map() keeps submission order, letting results regroup by config below
+    pairs = [(config_name, question, base_search_params(config))
+             for config_name, config in configs_to_test.items() for question in questions]
+    workers = max(1, min(args.workers, len(pairs)))
+    print(f"Running {len(pairs)} searches ({workers} at a time)...")
+    # Recorded next to the timings, since concurrency inflates them
+    all_results["workers"] = workers
+    cache_dir = EXA_CACHE_DIR if args.cache else None
+    search_results = []
+    with ThreadPoolExecutor(max_workers=workers) as executor, open(partial_file, 'ab') as partial:
+        outcomes = executor.map(lambda pair: test_exa_search(exa_client, *pair[1:], cache_dir), pairs)
+        for (config_name, _, _), result in zip(pairs, outcomes):
+            search_results.append(result)
+            partial.write(orjson.dumps({"config": config_name, **result}) + b"\n")
+            partial.flush()
+
+    # Generate answers if requested
+    if args.generate_answers:
+        print(f"🤖 Generating answers...")
+        generate_answers(llm, search_results, workers)
+
+    search_results = iter(search_results)
+
     # Test each configuration
     for config_name, config in configs_to_test.items():
         print(f"\n{'='*80}")
@@ -204,41 +406,38 @@ def main():
         }
 
         for i, question in enumerate(questions, 1):
-            print(f"\n[{i}/{len(questions)}]", end=" ")
-            result = test_exa_search(exa_client, question, config)
-
-            # Generate answer if requested
-            if args.generate_answers and result.get("success"):
-                print(f"    🤖 Generating answer...")
-                # Combine all text from results
-                context = "\n\n".join([r["text_preview"] for r in result["results"] if r.get("text_preview")])
-                answer, gen_time = generate_answer(llm, question, context)
-                result["answer"] = answer
-                result["gen_time"] = gen_time
-                print(f"    ✅ Answer generated in {gen_time:.2f}s")
+            print(f"\n[{i}/{len(questions)}]   Testing: {question[:60]}...")
+            result = next(search_results)
+            if result["success"]:
+                print(f"    ✅ Found {result['num_results']} results in {result['search_time']:.2f}s"
+                      + (" [cached]" if result["cached"] else "")
+                      + (f" ({result['attempts']} attempts)" if result["attempts"] > 1 else ""))
+            else:
+                print(f"    ❌ Error: {result['error']}")
+            if result.get("cache_error"):
+                print(f"    Warning: Could not cache Exa results: {result['cache_error']}")
+
+            if "answer" in result:
+                if result["answer"].startswith("Error generating answer"):
+                    print(f"    ❌ {result['answer']}")
+                else:
+                    print(f"    ✅ Answer generated in {result['gen_time']:.2f}s")
 
             config_results["questions"].append(result)
 
         all_results["results"][config_name] = config_results
 
         # Summary for this config
-        successful = sum(1 for r in config_results["questions"] if r.get("success"))
-        total_results = sum(r.get("num_results", 0) for r in config_results["questions"] if r.get("success"))
-        avg_time = sum(r.get("search_time", 0) for r in config_results["questions"]) / len(questions)
+        st = config_stats(config_results["questions"])
 
         print(f"\n📊 Summary for {config_name}:")
-        print(f"   Success Rate: {successful}/{len(questions)} ({successful/len(questions)*100:.1f}%)")
-        print(f"   Total Results Found: {total_results}")
-        print(f"   Avg Search Time: {avg_time:.2f}s")
+        print(f"   Success Rate: {st.successful}/{st.total_q} ({st.successful/st.total_q*100:.1f}%)")
+        print(f"   Total Results Found: {st.total_results}")
+        print(f"   Avg Search Time: {st.avg_time_text}")
 
     # Save results
-    timestamp = time.strftime("%Y%m%d-%H%M%S")
-    output_dir = "test_results/exa_tuning"
-    os.makedirs(output_dir, exist_ok=True)
-    output_file = f"{output_dir}/exa_test_{timestamp}.json"
-
-    with open(output_file, 'w') as f:
-        json.dump(all_results, f, indent=2)
+    Path(output_file).write_bytes(orjson.dumps(all_results, option=orjson.OPT_INDENT_2))
+    partial_file.unlink(missing_ok=True)
 
     print(f"\n{'='*80}")
     print(f"✅ EVALUATION COMPLETE")
@@ -255,10 +454,58 @@ def main():
     print(f"   4. Try adjusting configurations in this script and re-run")
 
 
+def _render_config_section(config_name, config_data):
+    """Render one configuration's detailed-results markdown section"""
+    lines = []
+    lines.append(f"### {config_name}\n")
+    lines.append(f"**Description:** {config_data['config']['description']}\n")
+    lines.append(f"**Settings:**")
+    lines.append(f"- Type: {config_data['config'].get('type')}")
+    lines.append(f"- Num Results: {config_data['config'].get('num_results')}")
+    lines.append(f"- Domains: {config_data['config'].get('include_domains', 'None')}\n")
+
+    for i, question_result in enumerate(config_data["questions"], 1):
+        lines.append(f"#### Question {i}: {question_result['question']}\n")
+
+        if question_result.get("success"):
+            lines.append(f"- **Status:** ✅ Success")
+            lines.append(f"- **Results Found:** {question_result['num_results']}")
+            if question_result.get("cached"):
+                lines.append("- **Search Time:** cached (not an Exa timing)")
+            else:
+                lines.append(f"- **Search Time:** {question_result['search_time']:.2f}s")
+            if question_result.get("attempts", 1) > 1:
+                lines.append(f"- **Attempts:** {question_result['attempts']}")
+
+            if question_result.get("results"):
+                lines.append(f"- **Top Result:** {question_result['results'][0]['title']}")
+                lines.append(f"- **URL:** {question_result['results'][0]['url']}")
+                lines.append(f"- **Content Preview:** {question_result['results'][0]['text_preview'][:150]}...")
+
+            if question_result.get("answer"):
+                lines.append(f"\n**Generated Answer:**")
+                lines.append(f"{question_result['answer'][:300]}...")
+        else:
+            lines.append(f"- **Status:** ❌ Failed")
+            lines.append(f"- **Error:** {question_result.get('error')}")
+            if question_result.get("attempts", 1) > 1:
+                lines.append(f"- **Attempts:** {question_result['attempts']}")
+
+        lines.append("")
+
+    lines.append("---\n")
+
+    return "\n".join(lines)
+
+
 def generate_comparison_report(results, output_dir, timestamp):
     """Generate a markdown report comparing configurations"""
     report_file = f"{output_dir}/exa_report_{timestamp}.md"
 
+    # Every section below reads these instead of re-scanning the questions
+    stats = {config_name: config_stats(config_data["questions"])
+             for config_name, config_data in results["results"].items()}
+
     lines = []
     lines.append("# Exa.ai Configuration Testing Report\n")
     lines.append(f"**Generated:** {results['timestamp']}")
@@ -271,17 +518,9 @@ def generate_comparison_report(results, output_dir, timestamp):
     lines.append("| Configuration | Success Rate | Avg Results | Avg Time | Total Results |")
     lines.append("|---------------|--------------|-------------|----------|---------------|")
 
-    for config_name, config_data in results["results"].items():
-        questions = config_data["questions"]
-        successful = sum(1 for q in questions if q.get("success"))
-        total_q = len(questions)
-        success_rate = f"{successful}/{total_q} ({successful/total_q*100:.0f}%)"
-
-        avg_results = sum(q.get("num_results", 0) for q in questions if q.get("success")) / max(successful, 1)
-        avg_time = sum(q.get("search_time", 0) for q in questions) / total_q
-        total_results = sum(q.get("num_results", 0) for q in questions if q.get("success"))
-
-        lines.append(f"| {config_name} | {success_rate} | {avg_results:.1f} | {avg_time:.2f}s | {total_results} |")
+    for config_name, st in stats.items():
+        success_rate = f"{st.successful}/{st.total_q} ({st.successful/st.total_q*100:.0f}%)"
+        lines.append(f"| {config_name} | {success_rate} | {st.avg_results:.1f} | {st.avg_time_text} | {st.total_results} |")
 
     lines.append("\n---\n")
 
@@ -289,56 +528,16 @@ def generate_comparison_report(results, output_dir, timestamp):
     lines.append("## Detailed Results by Configuration\n")
 
     for config_name, config_data in results["results"].items():
-        lines.append(f"### {config_name}\n")
-        lines.append(f"**Description:** {config_data['config']['description']}\n")
-        lines.append(f"**Settings:**")
-        lines.append(f"- Type: {config_data['config'].get('type')}")
-        lines.append(f"- Num Results: {config_data['config'].get('num_results')}")
-        lines.append(f"- Domains: {config_data['config'].get('include_domains', 'None')}\n")
-
-        for i, question_result in enumerate(config_data["questions"], 1):
-            lines.append(f"#### Question {i}: {question_result['question']}\n")
-
-            if question_result.get("success"):
-                lines.append(f"- **Status:** ✅ Success")
-                lines.append(f"- **Results Found:** {question_result['num_results']}")
-                lines.append(f"- **Search Time:** {question_result['search_time']:.2f}s")
-
-                if question_result.get("results"):
-                    lines.append(f"- **Top Result:** {question_result['results'][0]['title']}")
-                    lines.append(f"- **URL:** {question_result['results'][0]['url']}")
-                    lines.append(f"- **Content Preview:** {question_result['results'][0]['text_preview'][:150]}...")
-
-                if question_result.get("answer"):
-                    lines.append(f"\n**Generated Answer:**")
-                    lines.append(f"{question_result['answer'][:300]}...")
-            else:
-                lines.append(f"- **Status:** ❌ Failed")
-                lines.append(f"- **Error:** {question_result.get('error')}")
-
-            lines.append("")
-
-        lines.append("---\n")
+        lines.append(_render_config_section(config_name, config_data))
 
     # Recommendations
     lines.append("## Recommendations\n")
     lines.append("Based on the test results:\n")
 
-    # Find best config
-    best_config = None
-    best_score = 0
-
-    for config_name, config_data in results["results"].items():
-        questions = config_data["questions"]
-        successful = sum(1 for q in questions if q.get("success"))
-        total_results = sum(q.get("num_results", 0) for q in questions if q.get("success"))
-        score = successful * 100 + total_results
-
-        if score > best_score:
-            best_score = score
-            best_config = config_name
+    # Find best config (first one wins ties; a config with nothing found never counts as best)
+    best_config = max(stats, key=lambda k: stats[k].score, default=None)
 
-    if best_config:
+    if best_config and stats[best_config].score > 0:
         lines.append(f"1. **Best Configuration:** {best_config}")
         lines.append(f"2. **Why:** Highest success rate and result count")
 
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# Make the project root importable (api.app..., scripts...), like the scripts do themselves
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(PROJECT_ROOT))
@@ -0,0 +1,36 @@
+import pytest
+
+pytest.importorskip("anthropic")
+pytest.importorskip("pydantic")
+
+from scripts import ai_judge
+
+
+@pytest.fixture
+def judge(tmp_path):
+    return ai_judge.AIJudge(api_key="test-key", cache_dir=str(tmp_path))
+
+
+def test_cache_key_is_stable(judge):
+    assert judge._cache_path("Q", "A", ["https://a"]) == judge._cache_path("Q", "A", ["https://a"])
+
+
+@pytest.mark.parametrize("other", [
+    ("Q2", "A", ["https://a"]),
+    ("Q", "A2", ["https://a"]),
+    ("Q", "A", ["https://b"]),
+    ("Q", "A", []),
+    # Field boundaries are separated, so shifting text between fields can't collide
+    ("QA", "", ["https://a"]),
+])
+def test_cache_key_covers_graded_content(judge, other):
+    assert judge._cache_path(*other) != judge._cache_path("Q", "A", ["https://a"])
+
+
+def test_cache_key_covers_model_and_prompt_version(judge, tmp_path, monkeypatch):
+    base = judge._cache_path("Q", "A", [])
+    other_model = ai_judge.AIJudge(api_key="test-key", model="another-model", cache_dir=str(tmp_path))
+    assert other_model._cache_path("Q", "A", []) != base
+
+    monkeypatch.setattr(ai_judge, "JUDGE_PROMPT_VERSION", ai_judge.JUDGE_PROMPT_VERSION + 1)
+    assert judge._cache_path("Q", "A", []) != base
@@ -0,0 +1,155 @@
+import heapq
+import os
+import random
+import sys
+
+import orjson
+import pytest
+
+from scripts import generate_comparison_report as report
+
+SIZES = (report.NUMPY_MIN_RECORDS - 1, report.NUMPY_MIN_RECORDS, report.NUMPY_MIN_RECORDS + 1)
+
+
+def make_evaluations(n, seed=0):
+    rng = random.Random(seed)
+    evaluations = []
+    for i in range(n):
+        e = {
+            "question_id": i,
+            "overall_quality": rng.choice([40, 55.5, 70, 85, 100]),  # few values, so plenty of ties
+            "accuracy": rng.randint(0, 100),
+            "completeness": rng.randint(0, 100),
+            "clarity": rng.randint(0, 100),
+            "helpfulness": rng.randint(0, 100),
+            "hallucination": rng.random() < 0.1,
+            "verdict": rng.choice(["PASS", "HALLUCINATION"]) if rng.random() < 0.2 else None,
+        }
+        if i % 17 == 0:
+            # Sparse record, as in hand-edited or older judge output
+            del e["clarity"], e["verdict"]
+        evaluations.append(e)
+    return evaluations
+
+
+def make_results(n, seed=0):
+    rng = random.Random(seed)
+    results = []
+    for i in range(n):
+        metrics = {f: rng.uniform(0, 10) for f in report.PERFORMANCE_FIELDS}
+        if i % 13 == 0:
+            del metrics["gen_cost"]
+        results.append({"metrics": metrics} if i % 29 else {})
+    return results
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_numpy_paths_match_loop_paths(monkeypatch, n):
+    evaluations, results = make_evaluations(n), make_results(n)
+
+    # Force each path in turn on the same records around the real threshold
+    monkeypatch.setattr(report, "NUMPY_MIN_RECORDS", sys.maxsize)
+    loop = (report.calculate_quality_metrics(evaluations), report.calculate_performance_metrics(results))
+    monkeypatch.setattr(report, "NUMPY_MIN_RECORDS", 1)
+    vectorized = (report.calculate_quality_metrics(evaluations), report.calculate_performance_metrics(results))
+
+    assert vectorized[0] == pytest.approx(loop[0])
+    assert vectorized[1] == pytest.approx(loop[1])
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_extreme_questions_matches_heapq(n):
+    evaluations = make_evaluations(n)
+    key = report._overall_quality
+
+    best, worst = report.extreme_questions(evaluations)
+
+    # Identity, not just equal scores: ties must resolve to the same records as heapq
+    assert [id(e) for e in best] == [id(e) for e in heapq.nlargest(5, evaluations, key=key)]
+    assert [id(e) for e in worst] == [id(e) for e in heapq.nsmallest(5, evaluations, key=key)]
+
+
+def write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(data))
+
+
+def test_manifest_reuses_unchanged_files(tmp_path, capsys):
+    eval_file = tmp_path / "jina_claude" / "eval_20240101-000000.json"
+    write_json(eval_file, make_evaluations(3))
+
+    manifest = report.load_manifest(str(tmp_path))
+    first = report.load_json_files(str(tmp_path), "eval_", manifest)
+    report.save_manifest(str(tmp_path), manifest)
+    capsys.readouterr()
+
+    manifest = report.load_manifest(str(tmp_path))
+    second = report.load_json_files(str(tmp_path), "eval_", manifest)
+    assert second == first
+    assert "(unchanged)" in capsys.readouterr().out
+
+    # A changed file (different size) is parsed again
+    write_json(eval_file, make_evaluations(4))
+    third = report.load_json_files(str(tmp_path), "eval_", manifest)
+    assert len(third["jina_claude"]) == 4
+    assert "(unchanged)" not in capsys.readouterr().out
+
+
+def test_corrupt_manifest_is_ignored_with_warning(tmp_path, capsys):
+    (tmp_path / report.MANIFEST_FILE).write_bytes(b"{}")
+    (tmp_path / report.MANIFEST_DATA_FILE).write_bytes(b"not json")
+
+    assert report.load_manifest(str(tmp_path)) == {"files": {}, "data": {}}
+    assert "Warning" in capsys.readouterr().out
+
+
+@pytest.fixture
+def results_tree(tmp_path, monkeypatch):
+    """A working directory with one combination's results, no API key and a private insights path"""
+    write_json(tmp_path / "test_results" / "jina_claude" / "eval_20240101-000000.json", make_evaluations(5))
+    write_json(tmp_path / "test_results" / "jina_claude" / "results_20240101-000000.json", make_results(5))
+    insights_path = tmp_path / "insights.txt"
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    monkeypatch.setattr(report, "insights_cache_path", lambda summary_data: str(insights_path))
+    return tmp_path, insights_path
+
+
+def run_report(monkeypatch, capsys, *args):
+    monkeypatch.setattr(sys, "argv", ["generate_comparison_report.py", *args])
+    report.main()
+    return "RESULTS.md is up to date" in capsys.readouterr().out
+
+
+def test_report_skipped_only_with_cached_insights(results_tree, monkeypatch, capsys):
+    tmp_path, insights_path = results_tree
+
+    # Reports rendered with the fallback insights text never count as up to date
+    assert not run_report(monkeypatch, capsys)
+    assert not run_report(monkeypatch, capsys)
+
+    # Once real insights exist the report is rebuilt with them, then skipped while unchanged
+    insights_path.write_text("REAL INSIGHTS")
+    assert not run_report(monkeypatch, capsys)
+    assert "REAL INSIGHTS" in (tmp_path / "RESULTS.md").read_text()
+    assert run_report(monkeypatch, capsys)
+
+    assert not run_report(monkeypatch, capsys, "--force")
+
+    # Changed results invalidate the fingerprint
+    write_json(tmp_path / "test_results" / "jina_claude" / "eval_20240101-000000.json", make_evaluations(6))
+    assert not run_report(monkeypatch, capsys)
+
+
+def test_skipped_report_still_emits_json(results_tree, monkeypatch, capsys):
+    tmp_path, insights_path = results_tree
+    insights_path.write_text("REAL INSIGHTS")
+    run_report(monkeypatch, capsys)
+    for path in (tmp_path / "test_results").glob("benchmark_report_*.json"):
+        os.remove(path)
+
+    assert run_report(monkeypatch, capsys, "--emit-json")
+
+    emitted = list((tmp_path / "test_results").glob("benchmark_report_*.json"))
+    assert len(emitted) == 1
+    assert orjson.loads(emitted[0].read_bytes())[0]["name"] == "jina_claude"
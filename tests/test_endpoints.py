@@ -1,52 +1,65 @@
-import requests
+import asyncio
 import sys
 
+import httpx
+
 BASE_URL = "http://localhost:8000/api/v1"
 HEALTH_URL = "http://localhost:8000/health"
 
-def test_endpoints():
+async def check_health(client):
+    print(f"GET {HEALTH_URL}")
+    r = await client.get(HEALTH_URL)
+    r.raise_for_status()
+    assert r.json() == {"status": "healthy"}
+
+async def check_index(client):
+    print(f"POST {BASE_URL}/index")
+    payload = {"url": "https://example.com"}
+    r = await client.post(f"{BASE_URL}/index", json=payload)
+    r.raise_for_status()
+    data = r.json()
+    assert data["success"] is True
+    return data
+
+async def run_endpoint_tests():
     print("Running API Endpoint Tests...")
-    
-    # 1. Health Check
-    try:
-        print(f"GET {HEALTH_URL}")
-        r = requests.get(HEALTH_URL)
-        r.raise_for_status()
-        assert r.json() == {"status": "healthy"}
+
+    async with httpx.AsyncClient(timeout=60) as client:
+        # 1 + 2. Health check and index URL don't depend on each other, so run them together;
+        # indexing can take many seconds and no longer waits behind the health check
+        health, index = await asyncio.gather(
+            check_health(client), check_index(client), return_exceptions=True
+        )
+
+        if isinstance(health, Exception):
+            print(f"❌ Health check failed: {health}")
+            sys.exit(1)
         print("✅ Health check passed")
-    except Exception as e:
-        print(f"❌ Health check failed: {e}")
-        sys.exit(1)
-
-    # 2. Index URL
-    try:
-        print(f"POST {BASE_URL}/index")
-        payload = {"url": "https://example.com"}
-        r = requests.post(f"{BASE_URL}/index", json=payload)
-        r.raise_for_status()
-        data = r.json()
-        assert data["success"] is True
-        print(f"✅ Indexing passed (Collection: {data['collection_name']})")
-    except Exception as e:
-        print(f"❌ Indexing failed: {e}")
-        sys.exit(1)
-
-    # 3. Query
-    try:
-        print(f"POST {BASE_URL}/query")
-        payload = {"question": "What is this domain for?"}
-        r = requests.post(f"{BASE_URL}/query", json=payload)
-        r.raise_for_status()
-        data = r.json()
-        print(f"Answer: {data['answer']}")
-        assert len(data["answer"]) > 0
-        assert data["model_used"] is not None
-        print("✅ Query passed")
-    except Exception as e:
-        print(f"❌ Query failed: {e}")
-        sys.exit(1)
+
+        if isinstance(index, Exception):
+            print(f"❌ Indexing failed: {index}")
+            sys.exit(1)
+        print(f"✅ Indexing passed (Collection: {index['collection_name']})")
+
+        # 3. Query (needs the index from step 2)
+        try:
+            print(f"POST {BASE_URL}/query")
+            payload = {"question": "What is this domain for?"}
+            r = await client.post(f"{BASE_URL}/query", json=payload)
+            r.raise_for_status()
+            data = r.json()
+            print(f"Answer: {data['answer']}")
+            assert len(data["answer"]) > 0
+            assert data["model_used"] is not None
+            print("✅ Query passed")
+        except Exception as e:
+            print(f"❌ Query failed: {e}")
+            sys.exit(1)
 
     print("\n🎉 All tests passed!")
 
+def test_endpoints():
+    asyncio.run(run_endpoint_tests())
+
 if __name__ == "__main__":
     test_endpoints()
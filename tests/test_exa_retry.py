@@ -0,0 +1,77 @@
+import pytest
+
+pytest.importorskip("exa_py")
+pytest.importorskip("anthropic")
+
+from scripts import test_exa_tuning as exa_tuning
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class ResponseError(Exception):
+    def __init__(self, status_code):
+        super().__init__("request failed")
+        self.response = Response(status_code)
+
+
+@pytest.mark.parametrize("error, transient", [
+    (StatusError(429), True),
+    (StatusError(500), True),
+    (StatusError(503), True),
+    (StatusError(400), False),
+    (StatusError(401), False),
+    (ResponseError(502), True),
+    (ResponseError(404), False),
+    (ValueError("Request failed with status code 429: slow down"), True),
+    (ValueError("Request failed with status code 401: invalid key"), False),
+    (ConnectionResetError("reset"), True),
+    (TimeoutError("timed out"), True),
+    (ValueError("bad query"), False),
+    (KeyError("results"), False),
+])
+def test_is_transient(error, transient):
+    assert exa_tuning._is_transient(error) is transient
+
+
+class FlakyExa:
+    """Fails with the given errors first, then returns no results"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def search_and_contents(self, **params):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return type("SearchResponse", (), {"results": []})()
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(exa_tuning.time, "sleep", lambda seconds: None)
+
+
+def test_search_retries_transient_errors(no_backoff):
+    client = FlakyExa(ValueError("Request failed with status code 429: slow down"))
+    result = exa_tuning.test_exa_search(client, "What services?", {"type": "neural", "num_results": 3})
+
+    assert result["success"]
+    assert result["attempts"] == client.calls == 2
+
+
+def test_search_does_not_retry_permanent_errors(no_backoff):
+    client = FlakyExa(ValueError("Request failed with status code 401: invalid key"))
+    result = exa_tuning.test_exa_search(client, "What services?", {"type": "neural", "num_results": 3})
+
+    assert not result["success"]
+    assert result["attempts"] == client.calls == 1